@@ -1,7 +1,11 @@
+import bisect
+import heapq
 import random
 import matplotlib.pyplot as plt
 import math
 
+import numpy as np
+
 class Point:
     def __init__(self, x, y):
         self.x = x
@@ -69,6 +73,221 @@ def convex_hull(points):
 
     return hull
 
+# -------------------------------
+# Array versions: points are an (N, 2) array, hulls are CCW index arrays
+# -------------------------------
+def _cross_np(P, a, b, idx):
+    """cross(P[a], P[b], P[i]) for every i in idx, vectorised."""
+    ax, ay = P[a]
+    bx, by = P[b]
+    return (bx - ax) * (P[idx, 1] - ay) - (by - ay) * (P[idx, 0] - ax)
+
+
+def akl_toussaint(P):
+    """
+    Akl-Toussaint pruning: the extreme points in the 8 directions x, y,
+    x + y and x - y span an octagon inside the hull. Points strictly inside
+    it cannot be hull vertices. Returns the indices of the remaining points.
+    """
+    P = np.asarray(P, dtype=np.float64)
+    if len(P) < 9:
+        return np.arange(len(P))
+    s, d = P[:, 0] + P[:, 1], P[:, 0] - P[:, 1]
+    # CCW: left, lower-left, bottom, lower-right, right, upper-right, top, upper-left
+    octagon = [np.argmin(P[:, 0]), np.argmin(s), np.argmin(P[:, 1]), np.argmax(d),
+               np.argmax(P[:, 0]), np.argmax(s), np.argmax(P[:, 1]), np.argmin(d)]
+
+    inside = np.ones(len(P), dtype=bool)
+    everything = np.arange(len(P))
+    for a, b in zip(octagon, octagon[1:] + octagon[:1]):
+        if (P[a] != P[b]).any():
+            inside &= _cross_np(P, a, b, everything) > 0
+    return np.flatnonzero(~inside)
+
+
+def _extremes(P, idx):
+    """Lexicographically smallest and largest (x, y) among idx."""
+    order = np.lexsort((P[idx, 1], P[idx, 0]))
+    return idx[order[0]], idx[order[-1]], idx[order]
+
+
+def monotone_chain(P, prune=True):
+    """
+    Andrew's monotone chain on an (N, 2) array: sort by (x, y), then build
+    the lower and upper chains, popping every non-left turn.
+    Returns hull vertex indices in CCW order, starting at the smallest
+    (x, y); collinear points on an edge are left out.
+    """
+    P = np.asarray(P, dtype=np.float64)
+    idx = akl_toussaint(P) if prune else np.arange(len(P))
+    if len(idx) == 0:
+        return idx
+    first, last, order = _extremes(P, idx)
+    if (P[first] == P[last]).all():
+        return np.array([first])
+    xs, ys = P[order, 0].tolist(), P[order, 1].tolist()
+
+    def chain(seq):
+        out = []
+        for i in seq:
+            while len(out) >= 2:
+                o, a = out[-2], out[-1]
+                if (xs[a] - xs[o]) * (ys[i] - ys[o]) - (ys[a] - ys[o]) * (xs[i] - xs[o]) > 0:
+                    break
+                out.pop()
+            out.append(i)
+        return out
+
+    lower = chain(range(len(order)))
+    upper = chain(range(len(order) - 1, -1, -1))
+    return order[lower[:-1] + upper[:-1]]
+
+
+def quickhull(P, prune=True):
+    """
+    QuickHull on an (N, 2) array. Each step takes the points outside one
+    hull edge a -> b (to its right), keeps the farthest one c as a vertex
+    and splits the rest with boolean masks into the sets outside a -> c and
+    c -> b. An explicit stack replaces the recursion.
+    Returns the same CCW index array as monotone_chain.
+    """
+    P = np.asarray(P, dtype=np.float64)
+    idx = akl_toussaint(P) if prune else np.arange(len(P))
+    if len(idx) == 0:
+        return idx
+    a, b, _ = _extremes(P, idx)
+    if (P[a] == P[b]).all():
+        return np.array([a])
+
+    hull = []
+    # Items are either a vertex index or an edge (a, b, points outside it)
+    stack = [(b, a, idx), b, (a, b, idx), a]
+    while stack:
+        item = stack.pop()
+        if not isinstance(item, tuple):
+            hull.append(item)
+            continue
+        a, b, cand = item
+        cr = _cross_np(P, a, b, cand)
+        outside = cr < 0
+        if not outside.any():
+            continue
+        cand, cr = cand[outside], cr[outside]
+        far = cand[cr == cr.min()]
+        if len(far) > 1:
+            # Several farthest points on one line: take an end, not a middle one
+            far = far[np.argmax((P[far] - P[a]) @ (P[b] - P[a]))]
+        c = int(far.reshape(-1)[0])
+        stack.append((c, b, cand))
+        stack.append(c)
+        stack.append((a, c, cand))
+    return np.array(hull, dtype=np.int64)
+
+
+# -------------------------------
+# Online hull for point feeds
+# -------------------------------
+def _turn(o, a, b):
+    """cross() for (x, y) tuples."""
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def _chain(points):
+    """Andrew's pass over (x, y)-sorted tuples: the lower convex chain."""
+    out = []
+    for p in points:
+        if out and out[-1] == p:
+            continue
+        while len(out) >= 2 and _turn(out[-2], out[-1], p) <= 0:
+            out.pop()
+        out.append(p)
+    return out
+
+
+def _covers(chain, p):
+    """True if p is on or above the lower chain (inside its x range)."""
+    i = bisect.bisect_left(chain, p)
+    if i < len(chain) and chain[i] == p:
+        return True
+    return 0 < i < len(chain) and _turn(chain[i - 1], chain[i], p) >= 0
+
+
+def _insert(chain, p):
+    """Add p to a lower chain; returns False if p is not below it."""
+    if _covers(chain, p):
+        return False
+    i = bisect.bisect_left(chain, p)
+    chain.insert(i, p)
+    while i >= 2 and _turn(chain[i - 2], chain[i - 1], p) <= 0:
+        del chain[i - 1]
+        i -= 1
+    while i + 2 < len(chain) and _turn(p, chain[i + 1], chain[i + 2]) <= 0:
+        del chain[i + 1]
+    return True
+
+
+class IncrementalHull:
+    """
+    Convex hull that grows as points arrive.
+
+    The hull is kept as two chains sorted by (x, y): the lower chain, and
+    the upper chain stored as the lower chain of the negated points. A new
+    point is tested against each chain with one binary search, so interior
+    points are rejected in O(log h); only points outside are inserted, and
+    the neighbours they make non-convex are removed.
+    Batches are pruned and sorted with NumPy first and merged in. Two hulls
+    (e.g. built on separate chunks or in separate processes; the object
+    pickles as two lists) are combined in O(h1 + h2) with merge().
+    """
+
+    def __init__(self, points=None):
+        self.lower = []
+        self.upper = []
+        if points is not None:
+            self.extend(points)
+
+    def add(self, x, y):
+        """Add one point; returns True if the hull changed."""
+        p = (float(x), float(y))
+        changed = _insert(self.lower, p)
+        return _insert(self.upper, (-p[0], -p[1])) or changed
+
+    def contains(self, x, y):
+        """True if (x, y) lies inside or on the hull."""
+        p = (float(x), float(y))
+        return _covers(self.lower, p) and _covers(self.upper, (-p[0], -p[1]))
+
+    def _merge_chains(self, lower, upper):
+        self.lower = _chain(heapq.merge(self.lower, lower))
+        self.upper = _chain(heapq.merge(self.upper, upper))
+
+    def extend(self, points):
+        """Add an (N, 2) batch of points."""
+        P = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        if not len(P):
+            return
+        P = P[akl_toussaint(P)]
+        P = P[np.lexsort((P[:, 1], P[:, 0]))]
+        lower = _chain(map(tuple, P.tolist()))
+        upper = _chain(map(tuple, (-P[::-1]).tolist()))
+        self._merge_chains(lower, upper)
+
+    def merge(self, other):
+        """Fold another hull into this one; the other is left unchanged."""
+        self._merge_chains(other.lower, other.upper)
+        return self
+
+    def vertices(self):
+        """Hull vertices as an (h, 2) array in CCW order, like monotone_chain."""
+        if len(self.lower) <= 1:
+            return np.array(self.lower, dtype=np.float64).reshape(-1, 2)
+        ring = self.lower[:-1] + [(-x, -y) for x, y in self.upper[:-1]]
+        return np.array(ring, dtype=np.float64)
+
+    def __len__(self):
+        return len(self.vertices())
+
+
 # -------------------------------
 # Run and plot
 # -------------------------------
@@ -0,0 +1,56 @@
+# Object QuickHull vs the array hulls in ACT_4ConvexHull.py
+
+import time
+
+import numpy as np
+
+from ACT_4ConvexHull import IncrementalHull, Point, akl_toussaint, convex_hull, monotone_chain, quickhull
+
+# The Point-based version is too slow to time above this size
+OBJECT_LIMIT = 100_000
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def run(sizes, seed=0):
+    rng = np.random.default_rng(seed)
+    print(f"{'n':>9} {'kept':>7} {'objects (s)':>12} {'monotone (s)':>13} {'quickhull (s)':>14}")
+
+    for n in sizes:
+        P = rng.normal(size=(n, 2))
+        kept = len(akl_toussaint(P))
+        t_mc = timed(monotone_chain, P)
+        t_qh = timed(quickhull, P)
+        if n <= OBJECT_LIMIT:
+            t_obj = f"{timed(convex_hull, [Point(x, y) for x, y in P.tolist()]):12.3f}"
+        else:
+            t_obj = f"{'-':>12}"
+        print(f"{n:>9} {kept:>7} {t_obj} {t_mc:13.3f} {t_qh:14.3f}")
+
+
+def run_stream(n, batch, seed=0):
+    """Feed n points in batches: recompute from scratch vs IncrementalHull."""
+    P = np.random.default_rng(seed).normal(size=(n, 2))
+
+    start = time.perf_counter()
+    for end in range(batch, n + 1, batch):
+        monotone_chain(P[:end])
+    t_rerun = time.perf_counter() - start
+
+    start = time.perf_counter()
+    hull = IncrementalHull()
+    for lo in range(0, n, batch):
+        hull.extend(P[lo:lo + batch])
+    t_online = time.perf_counter() - start
+
+    print(f"stream of {n} points in batches of {batch}: "
+          f"rerun {t_rerun:.3f} s, incremental {t_online:.3f} s")
+
+
+if __name__ == "__main__":
+    run([1_000, 10_000, 100_000, 1_000_000, 5_000_000])
+    run_stream(1_000_000, 10_000)
@@ -1,5 +1,7 @@
 import random
 
+import numpy as np
+
 def fractional_knapsack(weights, values, W):
     n = len(weights)
     items = []
@@ -29,21 +31,132 @@ def fractional_knapsack(weights, values, W):
     return total_value
 
 
+def _ratios(w, v):
+    """Value per unit weight; weightless items come first (inf)."""
+    r = np.full(len(w), np.inf)
+    np.divide(v, w, out=r, where=w > 0)
+    return r
+
+
+def fractional_knapsack_select(weights, values, W):
+    """
+    Linear-time fractional knapsack (Balas-Zemel style): instead of
+    sorting, partition the items around the median ratio. If everything
+    better than the median fits, take it and continue in the worse half;
+    otherwise continue in the better half. Each round halves the
+    candidates, so the total work is O(n).
+    Returns (total value, indices taken whole, split item or None,
+    fraction of the split item taken).
+    """
+    w = np.asarray(weights, dtype=np.float64)
+    v = np.asarray(values, dtype=np.float64)
+    ratio = _ratios(w, v)
+
+    cand = np.arange(len(w))
+    taken = []
+    remaining = float(W)
+    while len(cand):
+        pivot = np.partition(ratio[cand], len(cand) // 2)[len(cand) // 2]
+        r = ratio[cand]
+        high, equal, low = cand[r > pivot], cand[r == pivot], cand[r < pivot]
+
+        high_weight = w[high].sum()
+        if high_weight > remaining:
+            cand = high
+            continue
+        taken.append(high)
+        remaining -= high_weight
+
+        # Fill from the items at the pivot ratio; stop if one is split
+        cum = np.cumsum(w[equal])
+        full = int(np.searchsorted(cum, remaining, side="right"))
+        taken.append(equal[:full])
+        if full < len(equal):
+            remaining -= cum[full - 1] if full else 0.0
+            split = int(equal[full])
+            return _selection(v, taken, split, remaining / w[split])
+        remaining -= cum[-1]
+        cand = low
+
+    return _selection(v, taken, None, 0.0)
+
+
+def _selection(v, parts, split, fraction):
+    taken = np.sort(np.concatenate(parts)) if parts else np.array([], dtype=np.int64)
+    total = v[taken].sum()
+    if fraction > 0:
+        total += v[split] * fraction
+    else:
+        split, fraction = None, 0.0
+    return float(total), taken, split, float(fraction)
+
+
+class FractionalKnapsack:
+    """
+    Sort once, answer many capacities. Items are sorted by ratio and the
+    prefix sums of their weights and values kept in arrays, so any W is a
+    binary search for the last item that still fits whole, plus part of
+    the next one. value() accepts a whole array of capacities.
+    """
+
+    def __init__(self, weights, values):
+        w = np.asarray(weights, dtype=np.float64)
+        v = np.asarray(values, dtype=np.float64)
+        ratio = _ratios(w, v)
+        self.order = np.argsort(-ratio, kind="stable")
+        self.ratio = np.append(ratio[self.order], 0.0)  # 0 past the last item
+        self.weights = w[self.order]
+        self.cum_weight = np.concatenate(([0.0], np.cumsum(self.weights)))
+        self.cum_value = np.concatenate(([0.0], np.cumsum(v[self.order])))
+
+    def _full(self, W):
+        """Number of items (in ratio order) that fit whole."""
+        return np.searchsorted(self.cum_weight, W, side="right") - 1
+
+    def value(self, W):
+        """Best total value for capacity W (scalar or array)."""
+        W = np.asarray(W, dtype=np.float64)
+        k = self._full(W)
+        best = self.cum_value[k] + (W - self.cum_weight[k]) * self.ratio[k]
+        return float(best) if best.ndim == 0 else best
+
+    def solve(self, W):
+        """(total value, indices taken whole, split item or None, fraction)."""
+        k = int(self._full(W))
+        taken = np.sort(self.order[:k])
+        remaining = W - self.cum_weight[k]
+        if k == len(self.order) or remaining <= 0:
+            return float(self.cum_value[k]), taken, None, 0.0
+        split = int(self.order[k])
+        fraction = float(remaining / self.weights[k])
+        return float(self.cum_value[k] + remaining * self.ratio[k]), taken, split, fraction
+
+
 # -------- MAIN PROGRAM --------
+if __name__ == "__main__":
+    # Take number of items
+    N = int(input("Enter number of items: "))
+
+    # Random weight & value generation
+    weights = [random.randint(1, 20) for _ in range(N)]
+    values  = [random.randint(10, 200) for _ in range(N)]
 
-# Take number of items
-N = int(input("Enter number of items: "))
+    print("\nGenerated Weights:", weights)
+    print("Generated Values :", values)
 
-# Random weight & value generation
-weights = [random.randint(1, 20) for _ in range(N)]
-values  = [random.randint(10, 200) for _ in range(N)]
+    # Take knapsack capacity
+    W = int(input("\nEnter knapsack capacity: "))
 
-print("\nGenerated Weights:", weights)
-print("Generated Values :", values)
+    # Calculate result
+    max_value = fractional_knapsack(weights, values, W)
+    print("\nMaximum Value that can be obtained =", max_value)
 
-# Take knapsack capacity
-W = int(input("\nEnter knapsack capacity: "))
+    value, taken, split, fraction = fractional_knapsack_select(weights, values, W)
+    print("Items taken whole:", taken.tolist())
+    if split is not None:
+        print(f"Item {split} taken in part: {fraction:.3f}")
 
-# Calculate result
-max_value = fractional_knapsack(weights, values, W)
-print("\nMaximum Value that can be obtained =", max_value)
+    # Many capacities against the same items
+    solver = FractionalKnapsack(weights, values)
+    capacities = [W // 2, W, 2 * W]
+    print("Capacities", capacities, "->", solver.value(capacities).tolist())
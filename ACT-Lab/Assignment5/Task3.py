@@ -1,5 +1,9 @@
 import random
-import heapq
+from collections import deque
+
+# Bits resolved per lookup in the decoder table
+TABLE_BITS = 12
+
 
 class Node:
     def __init__(self, char, freq):
@@ -13,31 +17,45 @@ class Node:
 
 
 def build_huffman_tree(characters, frequencies):
-    heap = []
-
-    for i in range(len(characters)):
-        heapq.heappush(heap, Node(characters[i], frequencies[i]))
-
-    while len(heap) > 1:
-        left = heapq.heappop(heap)
-        right = heapq.heappop(heap)
-
-        merged = Node(None, left.freq + right.freq)
-        merged.left = left
-        merged.right = right
-
-        heapq.heappush(heap, merged)
-
-    return heap[0]
-
-
-def generate_codes(root, code="", codes={}):
+    """
+    Two-queue construction: after sorting the leaves by frequency, merged
+    nodes are created in non-decreasing order of frequency, so the two
+    smallest nodes are always at the front of one of the two queues.
+    O(n) after the sort.
+    """
+    if not characters:
+        return None
+    leaves = deque(sorted((Node(c, f) for c, f in zip(characters, frequencies)),
+                          key=lambda node: node.freq))
+    merged = deque()
+
+    def pop_smallest():
+        if merged and (not leaves or merged[0].freq < leaves[0].freq):
+            return merged.popleft()
+        return leaves.popleft()
+
+    while len(leaves) + len(merged) > 1:
+        left = pop_smallest()
+        right = pop_smallest()
+
+        node = Node(None, left.freq + right.freq)
+        node.left = left
+        node.right = right
+
+        merged.append(node)
+
+    return (merged or leaves)[0]
+
+
+def generate_codes(root, code="", codes=None):
+    if codes is None:
+        codes = {}
     if root is None:
-        return
+        return codes
 
     if root.char is not None:
-        codes[root.char] = code
-        return
+        codes[root.char] = code or "0"  # a lone symbol still needs one bit
+        return codes
 
     generate_codes(root.left, code + "0", codes)
     generate_codes(root.right, code + "1", codes)
@@ -46,29 +64,184 @@ def generate_codes(root, code="", codes={}):
 
 def average_code_length(codes, frequencies, characters):
     total = sum(frequencies)
+    freq = dict(zip(characters, frequencies))
     weighted_sum = 0
     for ch, code in codes.items():
-        i = characters.index(ch)
-        weighted_sum += len(code) * frequencies[i]
+        weighted_sum += len(code) * freq[ch]
     return weighted_sum / total
 
 
+def canonical_codes(lengths):
+    """
+    Canonical Huffman codes from {symbol: code length}: symbols sorted by
+    (length, symbol) get consecutive codes, so only the lengths need to be
+    stored. Returns {symbol: (code, length)}.
+    """
+    codes = {}
+    code = 0
+    prev = 0
+    for sym, length in sorted(lengths.items(), key=lambda item: (item[1], item[0])):
+        code <<= length - prev
+        codes[sym] = (code, length)
+        code += 1
+        prev = length
+    return codes
+
+
+class HuffmanCode:
+    """
+    Canonical Huffman code over byte values 0..255.
+
+    encode() packs the codes into a bytearray (MSB first, zero padded).
+    decode() reads TABLE_BITS bits at a time and looks them up in a table
+    whose entries hold every symbol that is completely decoded by those
+    bits plus the number of bits they use, so most steps emit several
+    bytes at once. Codes longer than TABLE_BITS fall back to a canonical
+    bit-by-bit decode.
+    """
+
+    def __init__(self, lengths):
+        self.lengths = dict(lengths)
+        self.codes = canonical_codes(self.lengths)
+        self.max_length = max(self.lengths.values(), default=0)
+
+        self._bits = [None] * 256
+        for sym, (code, length) in self.codes.items():
+            self._bits[sym] = format(code, f"0{length}b")
+        self._build_decoder()
+
+    @classmethod
+    def from_frequencies(cls, frequencies):
+        """Code for a 256-entry byte histogram; zero counts get no code."""
+        symbols = [s for s in range(256) if frequencies[s]]
+        root = build_huffman_tree(symbols, [int(frequencies[s]) for s in symbols])
+        return cls({s: len(c) for s, c in generate_codes(root).items()})
+
+    @classmethod
+    def from_data(cls, data):
+        counts = [0] * 256
+        for b in data:
+            counts[b] += 1
+        return cls.from_frequencies(counts)
+
+    def _build_decoder(self):
+        # Canonical decoding state per length: first code, count, offset
+        self._first = [0] * (self.max_length + 2)
+        self._count = [0] * (self.max_length + 2)
+        self._offset = [0] * (self.max_length + 2)
+        self._sorted = sorted(self.codes, key=lambda s: (self.lengths[s], s))
+        for i, sym in enumerate(self._sorted):
+            code, length = self.codes[sym]
+            if not self._count[length]:
+                self._first[length] = code
+                self._offset[length] = i
+            self._count[length] += 1
+
+        # Single-symbol table, then greedy multi-symbol entries from it
+        size = 1 << TABLE_BITS
+        single = [None] * size
+        for sym, (code, length) in self.codes.items():
+            if length <= TABLE_BITS:
+                lo = code << (TABLE_BITS - length)
+                for i in range(lo, lo + (1 << (TABLE_BITS - length))):
+                    single[i] = (sym, length)
+
+        self._table = []
+        for peek in range(size):
+            out = bytearray()
+            rem = TABLE_BITS
+            while rem:
+                entry = single[((peek & ((1 << rem) - 1)) << (TABLE_BITS - rem))]
+                if entry is None or entry[1] > rem:
+                    break
+                out.append(entry[0])
+                rem -= entry[1]
+            self._table.append((bytes(out), TABLE_BITS - rem))
+
+    def encode(self, data):
+        """Packed code bits of data (zero padded to a whole byte)."""
+        try:
+            bits = "".join(map(self._bits.__getitem__, data))
+        except TypeError:
+            raise ValueError("data contains a byte with no code") from None
+        if not bits:
+            return bytearray()
+        bits += "0" * (-len(bits) % 8)
+        return bytearray(int(bits, 2).to_bytes(len(bits) // 8, "big"))
+
+    def _decode_long(self, acc, nacc, buf, pos):
+        """One code longer than the table: canonical decode bit by bit."""
+        code = 0
+        for length in range(1, self.max_length + 1):
+            if not nacc:
+                if pos == len(buf):
+                    break
+                acc, nacc, pos = buf[pos], 8, pos + 1
+            nacc -= 1
+            code = (code << 1) | ((acc >> nacc) & 1)
+            i = code - self._first[length]
+            if self._count[length] and 0 <= i < self._count[length]:
+                return self._sorted[self._offset[length] + i], acc & ((1 << nacc) - 1), nacc, pos
+        raise ValueError("corrupt Huffman data")
+
+    def decode(self, buf, count):
+        """The first count symbols encoded in buf."""
+        table, mask = self._table, (1 << TABLE_BITS) - 1
+        out = bytearray()
+        acc = nacc = pos = 0
+        n = len(buf)
+
+        while len(out) < count:
+            while nacc < TABLE_BITS and pos < n:
+                acc = (acc << 8) | buf[pos]
+                pos += 1
+                nacc += 8
+            if nacc >= TABLE_BITS:
+                syms, used = table[(acc >> (nacc - TABLE_BITS)) & mask]
+            else:
+                syms, used = table[(acc << (TABLE_BITS - nacc)) & mask]
+
+            if used > nacc:
+                # Ran into the padding: keep what came from real bits
+                out += syms
+                break
+            if used:
+                out += syms
+                nacc -= used
+                acc &= (1 << nacc) - 1
+            else:
+                sym, acc, nacc, pos = self._decode_long(acc, nacc, buf, pos)
+                out.append(sym)
+
+        if len(out) < count:
+            raise ValueError("Huffman data ended early")
+        return bytes(out[:count])
+
+
 # ---------- MAIN PROGRAM ----------
+if __name__ == "__main__":
+    N = int(input("Enter number of characters: "))
 
-N = int(input("Enter number of characters: "))
+    characters = [chr(65 + i) for i in range(N)]  # A, B, C, ...
+    frequencies = [random.randint(1, 50) for _ in range(N)]
 
-characters = [chr(65 + i) for i in range(N)]  # A, B, C, ...
-frequencies = [random.randint(1, 50) for _ in range(N)]
+    print("\nGenerated Characters:", characters)
+    print("Generated Frequencies:", frequencies)
 
-print("\nGenerated Characters:", characters)
-print("Generated Frequencies:", frequencies)
+    root = build_huffman_tree(characters, frequencies)
+    codes = generate_codes(root)
 
-root = build_huffman_tree(characters, frequencies)
-codes = generate_codes(root)
+    print("\nHuffman Codes:")
+    for c in codes:
+        print(c, ":", codes[c])
 
-print("\nHuffman Codes:")
-for c in codes:
-    print(c, ":", codes[c])
+    avg_len = average_code_length(codes, frequencies, characters)
+    print("\nAverage Code Length =", avg_len)
 
-avg_len = average_code_length(codes, frequencies, characters)
-print("\nAverage Code Length =", avg_len)
+    # Encode text drawn with these frequencies as a byte stream
+    text = "".join(random.choices(characters, weights=frequencies, k=1000)).encode()
+    codec = HuffmanCode.from_data(text)
+    packed = codec.encode(text)
+    assert codec.decode(packed, len(text)) == text
+    print(f"\n{len(text)} bytes -> {len(packed)} bytes packed "
+          f"({8 * len(packed) / len(text):.3f} bits per symbol)")
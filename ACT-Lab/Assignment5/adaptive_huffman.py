@@ -0,0 +1,222 @@
+# One-pass adaptive Huffman coding (FGK) for byte streams
+#
+# Encoder and decoder start from the same empty tree and apply the same
+# update after every symbol, so no frequency table is sent. A symbol seen
+# for the first time is sent as the code of the NYT ("not yet transmitted")
+# leaf followed by its value in RAW_BITS bits. The stream ends with the
+# EOF symbol, so a decoder fed from a socket knows where the data stops.
+# The tree never has more than 2 * SYMBOLS + 1 nodes, whatever the input
+# length.
+
+SYMBOLS = 257  # byte values 0..255 plus EOF
+EOF = 256
+RAW_BITS = 9
+MAX_NODES = 2 * SYMBOLS + 1  # every symbol has a leaf, plus the NYT leaf
+
+
+class _Tree:
+    """
+    FGK tree. Nodes are ids into flat lists; number[id] is the sibling
+    ordering (weights never decrease as numbers increase), and
+    node_at[k] is the id with number k. The root has the highest number.
+    """
+
+    def __init__(self):
+        self.weight = [0] * MAX_NODES
+        self.parent = [-1] * MAX_NODES
+        self.left = [-1] * MAX_NODES
+        self.right = [-1] * MAX_NODES
+        self.symbol = [-1] * MAX_NODES
+        self.number = [0] * MAX_NODES
+        self.node_at = [0] * MAX_NODES
+        self.leaf = [-1] * SYMBOLS
+
+        self.root = self.nyt = 0
+        self.size = 1
+        self.number[0] = MAX_NODES - 1
+        self.node_at[MAX_NODES - 1] = 0
+
+    def code(self, node):
+        """(bits, length) of the path from the root to node."""
+        bits = length = 0
+        parent = self.parent
+        while parent[node] != -1:
+            up = parent[node]
+            bits |= (self.right[up] == node) << length
+            length += 1
+            node = up
+        return bits, length
+
+    def _split_nyt(self, sym):
+        """Give the NYT leaf two children: a new NYT and the leaf for sym."""
+        old = self.nyt
+        nyt, leaf = self.size, self.size + 1
+        self.size += 2
+        k = self.number[old]
+        for node, num in ((leaf, k - 1), (nyt, k - 2)):
+            self.parent[node] = old
+            self.number[node] = num
+            self.node_at[num] = node
+        self.left[old], self.right[old] = nyt, leaf
+        self.symbol[leaf] = sym
+        self.leaf[sym] = leaf
+        self.nyt = nyt
+        return leaf
+
+    def _swap(self, a, b):
+        """Exchange the tree positions (and numbers) of nodes a and b."""
+        pa, pb = self.parent[a], self.parent[b]
+        if pa == pb:
+            self.left[pa], self.right[pa] = self.right[pa], self.left[pa]
+        else:
+            if self.right[pa] == a:
+                self.right[pa] = b
+            else:
+                self.left[pa] = b
+            if self.right[pb] == b:
+                self.right[pb] = a
+            else:
+                self.left[pb] = a
+            self.parent[a], self.parent[b] = pb, pa
+
+        na, nb = self.number[a], self.number[b]
+        self.number[a], self.number[b] = nb, na
+        self.node_at[na], self.node_at[nb] = b, a
+
+    def update(self, sym):
+        """Count one more sym, restoring the sibling property on the way up."""
+        weight, number, node_at = self.weight, self.number, self.node_at
+        node = self.leaf[sym]
+        if node == -1:
+            node = self._split_nyt(sym)
+
+        while node != -1:
+            # Highest-numbered node of the same weight (the block leader)
+            k = number[node]
+            w = weight[node]
+            while k + 1 < MAX_NODES and weight[node_at[k + 1]] == w:
+                k += 1
+            leader = node_at[k]
+            if leader != node and leader != self.parent[node]:
+                self._swap(node, leader)
+            weight[node] += 1
+            node = self.parent[node]
+
+
+class AdaptiveEncoder:
+    """
+    Push-style encoder: push() takes any amount of data and returns the
+    complete bytes produced so far; finish() writes EOF and the padding.
+    """
+
+    def __init__(self):
+        self.tree = _Tree()
+        self.acc = 0
+        self.nacc = 0
+
+    def _emit(self, sym, out):
+        tree = self.tree
+        node = tree.leaf[sym]
+        if node == -1:
+            bits, length = tree.code(tree.nyt)
+            bits = (bits << RAW_BITS) | sym
+            length += RAW_BITS
+        else:
+            bits, length = tree.code(node)
+        tree.update(sym)
+
+        acc = (self.acc << length) | bits
+        nacc = self.nacc + length
+        while nacc >= 8:
+            nacc -= 8
+            out.append((acc >> nacc) & 0xFF)
+        self.acc, self.nacc = acc & ((1 << nacc) - 1), nacc
+
+    def push(self, data):
+        out = bytearray()
+        for sym in data:
+            self._emit(sym, out)
+        return bytes(out)
+
+    def finish(self):
+        out = bytearray()
+        self._emit(EOF, out)
+        if self.nacc:
+            out.append((self.acc << (8 - self.nacc)) & 0xFF)
+        self.acc = self.nacc = 0
+        return bytes(out)
+
+
+class AdaptiveDecoder:
+    """
+    Push-style decoder: push() takes any slice of the encoded stream
+    (down to single bytes) and returns the data decoded from it.
+    `finished` becomes True once EOF has been read; later input is ignored.
+    """
+
+    def __init__(self):
+        self.tree = _Tree()
+        self.finished = False
+        self.node = self.tree.root
+        self.raw_left = RAW_BITS  # an empty tree starts with a raw symbol
+        self.raw = 0
+
+    def _symbol(self, sym, out):
+        if sym == EOF:
+            self.finished = True
+        else:
+            out.append(sym)
+        tree = self.tree
+        tree.update(sym)
+        self.node = tree.root
+
+    def push(self, data):
+        out = bytearray()
+        tree = self.tree
+        left, right, symbol, nyt = tree.left, tree.right, tree.symbol, tree.nyt
+        for byte in data:
+            for shift in range(7, -1, -1):
+                if self.finished:
+                    return bytes(out)
+                bit = (byte >> shift) & 1
+                if self.raw_left:
+                    self.raw = (self.raw << 1) | bit
+                    self.raw_left -= 1
+                    if not self.raw_left:
+                        self._symbol(self.raw, out)
+                        nyt = tree.nyt
+                    continue
+
+                node = right[self.node] if bit else left[self.node]
+                if left[node] != -1:
+                    self.node = node
+                elif node == nyt:
+                    self.raw_left, self.raw = RAW_BITS, 0
+                else:
+                    self._symbol(symbol[node], out)
+        return bytes(out)
+
+
+def encode(data):
+    encoder = AdaptiveEncoder()
+    return encoder.push(data) + encoder.finish()
+
+
+def decode(packed):
+    decoder = AdaptiveDecoder()
+    data = decoder.push(packed)
+    if not decoder.finished:
+        raise ValueError("adaptive Huffman stream ended before EOF")
+    return data
+
+
+# Example usage
+if __name__ == "__main__":
+    text = b"abracadabra, abracadabra, abracadabra!"
+    packed = encode(text)
+    print(f"{len(text)} bytes -> {len(packed)} bytes")
+
+    # Feed the decoder one byte at a time, as a socket reader might
+    decoder = AdaptiveDecoder()
+    restored = b"".join(decoder.push(packed[i:i + 1]) for i in range(len(packed)))
+    print("Round trip ok:", restored == text)
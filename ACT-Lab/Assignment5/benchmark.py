@@ -0,0 +1,78 @@
+# Throughput of huffman_compress.py against zlib at its fastest level
+
+import io
+import os
+import random
+import sys
+import time
+import zlib
+
+import adaptive_huffman
+from huffman_compress import byte_histogram, compress_stream, iter_decompress
+from Task3 import HuffmanCode
+
+
+def sample_data(size, seed=0):
+    """Text-like bytes: skewed letter frequencies, so Huffman has work to do."""
+    random.seed(seed)
+    alphabet = bytes(range(32, 127))
+    weights = [1.1 ** -i for i in range(len(alphabet))]
+    return bytes(random.choices(alphabet, weights=weights, k=size))
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def run(data, max_workers):
+    mb = len(data) / 1e6
+    print(f"{mb:.1f} MB input")
+    print(f"{'codec':>16} {'ratio':>7} {'compress MB/s':>14} {'decompress MB/s':>16}")
+
+    packed, t_c = timed(lambda: zlib.compress(data, 1))
+    _, t_d = timed(lambda: zlib.decompress(packed))
+    print(f"{'zlib level 1':>16} {len(packed) / len(data):7.3f} {mb / t_c:14.1f} {mb / t_d:16.1f}")
+
+    for workers in range(1, max_workers + 1):
+        out = io.BytesIO()
+        _, t_c = timed(lambda: compress_stream(io.BytesIO(data), out, workers=workers))
+        packed = out.getvalue()
+        restored, t_d = timed(lambda: b"".join(iter_decompress(io.BytesIO(packed), workers)))
+        assert restored == data
+        name = f"huffman x{workers}"
+        print(f"{name:>16} {len(packed) / len(data):7.3f} {mb / t_c:14.1f} {mb / t_d:16.1f}")
+
+
+def run_adaptive(data):
+    """One-pass adaptive coding vs the static two-pass codec."""
+    mb = len(data) / 1e6
+    print(f"\n{mb:.1f} MB input, single stream")
+    print(f"{'codec':>16} {'ratio':>7} {'encode MB/s':>12} {'decode MB/s':>12}")
+
+    def static_encode():
+        code = HuffmanCode.from_frequencies(byte_histogram(data))  # pass 1
+        return code, code.encode(data)                             # pass 2
+
+    (code, packed), t_e = timed(static_encode)
+    restored, t_d = timed(lambda: code.decode(packed, len(data)))
+    assert restored == data
+    print(f"{'static':>16} {(len(packed) + 256) / len(data):7.3f} {mb / t_e:12.2f} {mb / t_d:12.2f}")
+
+    packed, t_e = timed(lambda: adaptive_huffman.encode(data))
+    restored, t_d = timed(lambda: adaptive_huffman.decode(packed))
+    assert restored == data
+    print(f"{'adaptive (FGK)':>16} {len(packed) / len(data):7.3f} {mb / t_e:12.2f} {mb / t_d:12.2f}")
+
+
+if __name__ == "__main__":
+    # Usage: python benchmark.py [file] [max_workers]
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], "rb") as f:
+            data = f.read()
+    else:
+        data = sample_data(8 << 20)
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+    run(data, max_workers)
+    run_adaptive(data[:1 << 20])
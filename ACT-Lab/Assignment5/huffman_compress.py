@@ -0,0 +1,183 @@
+# Block-parallel Huffman file compressor built on the codec in Task3.py
+#
+# File layout (little endian):
+#   file header   magic "HUFF", version, block size
+#   block frames  one per block of the input, each independently coded:
+#       header    magic "HB", kind, raw length, payload length, CRC-32
+#       lengths   256 code lengths, one byte each (kind HUFFMAN only)
+#       payload   packed code bits, or the raw bytes (kind STORED)
+# Every frame carries its own sizes, so a reader can skip from header to
+# header to find block i, or decode the file one block at a time.
+
+import struct
+import sys
+import zlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from Task3 import HuffmanCode
+
+FILE_MAGIC = b"HUFF"
+FILE_VERSION = 1
+FILE_HEADER = struct.Struct("<4sBI")
+BLOCK_MAGIC = b"HB"
+BLOCK_HEADER = struct.Struct("<2sBIII")
+STORED, HUFFMAN = 0, 1
+
+DEFAULT_BLOCK = 1 << 20
+
+
+def byte_histogram(block):
+    """Count of every byte value, vectorised."""
+    return np.bincount(np.frombuffer(block, dtype=np.uint8), minlength=256)
+
+
+def compress_block(block):
+    """One self-contained frame for block; stored raw if coding does not help."""
+    crc = zlib.crc32(block)
+    if block:
+        code = HuffmanCode.from_frequencies(byte_histogram(block))
+        payload = code.encode(block)
+        if len(payload) + 256 < len(block):
+            lengths = bytes(code.lengths.get(s, 0) for s in range(256))
+            return (BLOCK_HEADER.pack(BLOCK_MAGIC, HUFFMAN, len(block), len(payload), crc)
+                    + lengths + payload)
+    return BLOCK_HEADER.pack(BLOCK_MAGIC, STORED, len(block), len(block), crc) + bytes(block)
+
+
+def _parse_header(header):
+    magic, kind, raw_len, payload_len, crc = BLOCK_HEADER.unpack(header)
+    if magic != BLOCK_MAGIC or kind not in (STORED, HUFFMAN):
+        raise ValueError("not a Huffman block frame")
+    return kind, raw_len, payload_len, crc
+
+
+def frame_size(header):
+    """Total size of the frame that starts with this header."""
+    kind, _, payload_len, _ = _parse_header(header)
+    return BLOCK_HEADER.size + (256 if kind == HUFFMAN else 0) + payload_len
+
+
+def decompress_block(frame):
+    kind, raw_len, payload_len, crc = _parse_header(frame[:BLOCK_HEADER.size])
+    body = memoryview(frame)[BLOCK_HEADER.size:]
+    if kind == HUFFMAN:
+        lengths = {s: n for s, n in enumerate(body[:256]) if n}
+        block = HuffmanCode(lengths).decode(body[256:256 + payload_len], raw_len)
+    else:
+        block = bytes(body[:raw_len])
+    if zlib.crc32(block) != crc:
+        raise ValueError("block checksum mismatch")
+    return block
+
+
+# ---------- Streams of blocks ----------
+
+def _read_blocks(f, block_size):
+    while True:
+        block = f.read(block_size)
+        if not block:
+            return
+        yield block
+
+
+def _read_header(f):
+    header = f.read(FILE_HEADER.size)
+    magic, version, block_size = FILE_HEADER.unpack(header)
+    if magic != FILE_MAGIC or version != FILE_VERSION:
+        raise ValueError("not a Huffman-compressed file")
+    return block_size
+
+
+def read_frames(f):
+    """Yield the frames of an open compressed file, one at a time."""
+    _read_header(f)
+    while True:
+        header = f.read(BLOCK_HEADER.size)
+        if not header:
+            return
+        yield header + f.read(frame_size(header) - BLOCK_HEADER.size)
+
+
+def _ordered_map(fn, items, workers):
+    """
+    fn over items in order, keeping at most 2 * workers blocks in flight
+    so large files are never held in memory at once.
+    """
+    if workers is None or workers <= 1:
+        yield from map(fn, items)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for item in items:
+            pending.append(pool.submit(fn, item))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def compress_stream(src, dst, block_size=DEFAULT_BLOCK, workers=None):
+    """Compress the file object src into dst; returns bytes written."""
+    dst.write(FILE_HEADER.pack(FILE_MAGIC, FILE_VERSION, block_size))
+    written = FILE_HEADER.size
+    for frame in _ordered_map(compress_block, _read_blocks(src, block_size), workers):
+        dst.write(frame)
+        written += len(frame)
+    return written
+
+
+def iter_decompress(src, workers=None):
+    """Yield the decompressed blocks of the file object src in order."""
+    yield from _ordered_map(decompress_block, read_frames(src), workers)
+
+
+def compress_file(src_path, dst_path, block_size=DEFAULT_BLOCK, workers=None):
+    with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+        return compress_stream(src, dst, block_size, workers)
+
+
+def decompress_file(src_path, dst_path, workers=None):
+    with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+        for block in iter_decompress(src, workers):
+            dst.write(block)
+
+
+# ---------- Random access ----------
+
+def block_index(f):
+    """
+    [(offset, raw length)] for every frame, found by hopping from header
+    to header without reading the payloads.
+    """
+    f.seek(0)
+    _read_header(f)
+    index = []
+    while True:
+        offset = f.tell()
+        header = f.read(BLOCK_HEADER.size)
+        if not header:
+            return index
+        index.append((offset, _parse_header(header)[1]))
+        f.seek(offset + frame_size(header))
+
+
+def read_block(f, offset):
+    """Decompress the single frame starting at offset (see block_index)."""
+    f.seek(offset)
+    header = f.read(BLOCK_HEADER.size)
+    return decompress_block(header + f.read(frame_size(header) - BLOCK_HEADER.size))
+
+
+if __name__ == "__main__":
+    # Usage: python huffman_compress.py (c|d) SRC DST [workers]
+    mode, src_path, dst_path = sys.argv[1:4]
+    workers = int(sys.argv[4]) if len(sys.argv) > 4 else None
+    if mode == "c":
+        size = compress_file(src_path, dst_path, workers=workers)
+        print(f"wrote {size} bytes to {dst_path}")
+    else:
+        decompress_file(src_path, dst_path, workers=workers)
+        print(f"decompressed to {dst_path}")
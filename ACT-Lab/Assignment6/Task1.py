@@ -1,5 +1,9 @@
+import heapq
 import random
 
+import numpy as np
+
+
 def activity_selection(start, finish):
     n = len(start)
 
@@ -17,21 +21,168 @@ def activity_selection(start, finish):
     return selected
 
 
+# ---------- NumPy versions: activities are arrays, results are indices ----------
+
+def _first_at_least(s, lo, value):
+    """First j >= lo with s[j] >= value (len(s) if none), scanning in doubling windows."""
+    width = 64
+    while lo < len(s):
+        hit = np.flatnonzero(s[lo:lo + width] >= value)
+        if len(hit):
+            return lo + int(hit[0])
+        lo += width
+        width *= 2
+    return len(s)
+
+
+def _greedy_sorted(s, f, last_finish=-np.inf):
+    """
+    The greedy rule on activities already sorted by finish time.
+
+    nxt[i], the first later activity that starts at or after f[i], is found
+    for every i at once: the prefix maximum of the start times is sorted,
+    so one searchsorted over it gives the first position whose start
+    reaches f[i]. Only zero-length activities can make that position point
+    back to i or before; those few are fixed with a forward scan. The
+    selection is then the chain i -> nxt[i] from the first activity that
+    starts after last_finish.
+    Returns (selected positions, finish time of the last one).
+    """
+    n = len(s)
+    if not n:
+        return np.array([], dtype=np.int64), last_finish
+    top = np.maximum.accumulate(s)
+    i = int(np.searchsorted(top, last_finish, side="left"))
+    if i == n:
+        return np.array([], dtype=np.int64), last_finish
+
+    nxt = np.searchsorted(top, f, side="left")
+    for j in np.flatnonzero(nxt <= np.arange(n)):
+        nxt[j] = _first_at_least(s, j + 1, f[j])
+
+    chosen = []
+    while i < n:
+        chosen.append(i)
+        i = nxt.item(i)
+    chosen = np.array(chosen, dtype=np.int64)
+    return chosen, f[chosen[-1]]
+
+
+def select_activities(start, finish):
+    """
+    Maximum set of non-overlapping activities (an activity may start when
+    the previous one finishes). Returns their indices in finish order.
+    """
+    s = np.asarray(start)
+    f = np.asarray(finish)
+    order = np.argsort(f, kind="stable")
+    chosen, _ = _greedy_sorted(s[order], f[order])
+    return order[chosen]
+
+
+def select_activities_stream(chunks):
+    """
+    Streaming greedy for input already sorted by finish time, e.g. read
+    from disk in pieces. chunks yields (start, finish) array pairs; for
+    each one this yields the global indices selected from it. Only the
+    last finish time and the running offset are kept between chunks.
+    """
+    last_finish = -np.inf
+    offset = 0
+    for start, finish in chunks:
+        s, f = np.asarray(start), np.asarray(finish)
+        chosen, last_finish = _greedy_sorted(s, f, last_finish)
+        yield chosen + offset
+        offset += len(s)
+
+
+def weighted_interval_scheduling(start, finish, weight):
+    """
+    Maximum total weight of non-overlapping activities.
+    After sorting by finish time, p[j] (how many activities finish by the
+    time j starts) comes from one vectorised binary search, and
+        best[j + 1] = max(best[j], weight[j] + best[p[j]])
+    Returns (best total, chosen indices in finish order).
+    """
+    s = np.asarray(start)
+    f = np.asarray(finish)
+    w = np.asarray(weight)
+    # Ties on finish time put zero-length activities last, so everything
+    # compatible with one of them comes before it
+    order = np.lexsort((s, f))
+    s, f, w = s[order], f[order], w[order]
+    p = np.minimum(np.searchsorted(f, s, side="right"), np.arange(len(order)))
+
+    n = len(order)
+    best = np.zeros(n + 1, dtype=np.result_type(w, np.int64))
+    take = np.zeros(n, dtype=bool)
+    for j in range(n):
+        with_j = w.item(j) + best.item(p.item(j))
+        if with_j > best.item(j):
+            best[j + 1] = with_j
+            take[j] = True
+        else:
+            best[j + 1] = best[j]
+
+    # Walk back from the end: a taken activity jumps to its predecessor
+    chosen = []
+    j = n
+    while j > 0:
+        if take[j - 1]:
+            chosen.append(j - 1)
+            j = p.item(j - 1)
+        else:
+            j -= 1
+    return best.item(n), order[np.array(chosen[::-1], dtype=np.int64)]
+
+
+def partition_rooms(start, finish):
+    """
+    Fewest rooms that hold every activity without overlaps. Activities are
+    taken in (start, finish) order, so a zero-length activity comes before
+    a longer one starting at the same time; a min-heap of (finish time,
+    room) tells whether the room that frees up first is free by then.
+    Returns (number of rooms, room of each activity).
+    """
+    s = np.asarray(start)
+    f = np.asarray(finish)
+    room = np.empty(len(s), dtype=np.int64)
+    heap = []
+    for i in np.lexsort((f, s)).tolist():
+        if heap and heap[0][0] <= s.item(i):
+            _, r = heapq.heapreplace(heap, (f.item(i), heap[0][1]))
+        else:
+            r = len(heap)
+            heapq.heappush(heap, (f.item(i), r))
+        room[i] = r
+    return len(heap), room
+
+
 # ---------- MAIN PROGRAM ----------
+if __name__ == "__main__":
+    N = int(input("Enter number of activities: "))
+
+    # Randomly generating start and finish times
+    start = sorted([random.randint(1, 20) for _ in range(N)])
+    finish = [s + random.randint(1, 10) for s in start]   # finish > start
+
+    print("\nGenerated Start Times:", start)
+    print("Generated Finish Times:", finish)
 
-N = int(input("Enter number of activities: "))
+    selected = activity_selection(start, finish)
 
-# Randomly generating start and finish times
-start = sorted([random.randint(1, 20) for _ in range(N)])
-finish = [s + random.randint(1, 10) for s in start]   # finish > start
+    print("\nSelected Activities (start, finish):")
+    for act in selected:
+        print(act)
 
-print("\nGenerated Start Times:", start)
-print("Generated Finish Times:", finish)
+    print("\nMaximum Activities =", len(selected))
 
-selected = activity_selection(start, finish)
+    print("\nSelected indices (NumPy):", select_activities(start, finish).tolist())
 
-print("\nSelected Activities (start, finish):")
-for act in selected:
-    print(act)
+    weights = [random.randint(1, 10) for _ in range(N)]
+    total, chosen = weighted_interval_scheduling(start, finish, weights)
+    print("Weights:", weights)
+    print("Best total weight =", total, "using", chosen.tolist())
 
-print("\nMaximum Activities =", len(selected))
+    rooms, room = partition_rooms(start, finish)
+    print("Rooms needed =", rooms, "assignment:", room.tolist())
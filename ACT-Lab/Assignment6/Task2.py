@@ -1,56 +1,433 @@
 import heapq
+import numbers
+import os
 import random
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 
-def dijkstra(v, edges, source):
-    graph = [[] for _ in range(v)]
+import numpy as np
+
+INF = float('inf')
+
+
+class CSRGraph:
+    """
+    Graph stored in compressed sparse row form, built once and reused.
+    The neighbours of node u are targets[offsets[u]:offsets[u + 1]] with the
+    matching weights. Using typed arrays costs 12 bytes per directed edge
+    instead of a tuple and two boxed numbers per edge in Python lists.
+    Integer weights are kept as array('q'), so distances over them stay
+    integers; any other weights are stored as array('d').
+    """
+
+    def __init__(self, v, offsets, targets, weights, directed=False):
+        self.v = v
+        self.offsets = offsets   # array('q'), length v + 1
+        self.targets = targets   # array('i')
+        self.weights = weights   # array('q') or array('d')
+        self.directed = directed
+        self._reverse = None
+
+    @classmethod
+    def from_edges(cls, v, edges, directed=False):
+        """Build from (u, w, weight) tuples; undirected edges are stored both ways."""
+        degree = [0] * (v + 1)
+        for u, w, _ in edges:
+            degree[u + 1] += 1
+            if not directed:
+                degree[w + 1] += 1
+
+        # Prefix sums of the degrees give each node's start offset
+        for i in range(v):
+            degree[i + 1] += degree[i]
+        offsets = array('q', degree)
+
+        m = offsets[v]
+        kind = 'q' if all(isinstance(wt, numbers.Integral) for _, _, wt in edges) else 'd'
+        targets = array('i', bytes(4 * m))
+        weights = array(kind, bytes(8 * m))
+        fill = list(offsets[:v])
+        for u, w, wt in edges:
+            targets[fill[u]] = w
+            weights[fill[u]] = wt
+            fill[u] += 1
+            if not directed:
+                targets[fill[w]] = u
+                weights[fill[w]] = wt
+                fill[w] += 1
+
+        return cls(v, offsets, targets, weights, directed)
 
-    # Build adjacency list
-    for u, w, wt in edges:
-        graph[u].append((w, wt))
-        graph[w].append((u, wt))  # undirected graph
+    def neighbours(self, u):
+        a, b = self.offsets[u], self.offsets[u + 1]
+        return zip(self.targets[a:b], self.weights[a:b])
 
-    dist = [float('inf')] * v
-    dist[source] = 0
+    def num_edges(self):
+        return len(self.targets)
 
-    pq = [(0, source)]  # (distance, node)
+    def reversed(self):
+        """
+        Graph with every edge flipped (the graph itself if undirected).
+        Built on first use and cached, since point-to-point searches ask
+        for it on every query.
+        """
+        if not self.directed:
+            return self
+        if self._reverse is None:
+            edges = []
+            for u in range(self.v):
+                for w, wt in self.neighbours(u):
+                    edges.append((w, u, wt))
+            self._reverse = CSRGraph.from_edges(self.v, edges, directed=True)
+        return self._reverse
+
+
+def shortest_paths(graph, source, target=None, stats=None):
+    """
+    Dijkstra over a CSRGraph.
+    `source` may be a single node or an iterable of nodes (all at distance 0).
+    With a target the search stops as soon as the target is settled, so
+    only distances of settled nodes are final.
+    Returns (dist, pred) where pred[u] is the previous node on a shortest
+    path to u (-1 for sources and unreached nodes).
+    If a stats dict is given, stats["settled"] is set to the number of
+    nodes settled.
+    """
+    sources = [int(source)] if isinstance(source, numbers.Integral) else [int(s) for s in source]
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+
+    dist = [INF] * graph.v
+    pred = [-1] * graph.v
+    pq = []
+    for s in sources:
+        dist[s] = 0
+        pq.append((0, s))
+    heapq.heapify(pq)
+    settled = 0
 
     while pq:
         d, node = heapq.heappop(pq)
 
         if d > dist[node]:
             continue
+        settled += 1
+        if node == target:
+            break
 
-        for neigh, weight in graph[node]:
-            if dist[node] + weight < dist[neigh]:
-                dist[neigh] = dist[node] + weight
-                heapq.heappush(pq, (dist[neigh], neigh))
+        a, b = offsets[node], offsets[node + 1]
+        for neigh, weight in zip(targets[a:b], weights[a:b]):
+            nd = d + weight
+            if nd < dist[neigh]:
+                dist[neigh] = nd
+                pred[neigh] = node
+                heapq.heappush(pq, (nd, neigh))
 
-    return dist
+    if stats is not None:
+        stats["settled"] = settled
+    return dist, pred
 
 
-# ---------- MAIN PROGRAM ----------
+def path_to(pred, target):
+    """Follow predecessor links back from target; returns the node list."""
+    path = [target]
+    while pred[path[-1]] != -1:
+        path.append(pred[path[-1]])
+    path.reverse()
+    return path
+
+
+def shortest_path(graph, source, target):
+    """Distance and node path from source to target ([] if unreachable)."""
+    dist, pred = shortest_paths(graph, source, target)
+    if dist[target] == INF:
+        return INF, []
+    return dist[target], path_to(pred, target)
+
+
+def batch_shortest_paths(graph, sources):
+    """Distance list from each source in turn, sharing one graph."""
+    for s in sources:
+        yield s, shortest_paths(graph, s)[0]
+
+
+def bidirectional_shortest_path(graph, source, target, reverse=None, stats=None):
+    """
+    Point-to-point Dijkstra grown from both ends at once.
+    The forward search runs on graph, the backward one on its reverse
+    (`reverse` if given, else graph.reversed(), which is cached on the
+    graph). The side with the smaller queue head is expanded next. `best` is the shortest
+    s-t route seen through any edge joining the two searches, and the
+    search stops once the two queue heads together cannot beat it.
+    Returns (distance, path).
+    """
+    if source == target:
+        if stats is not None:
+            stats["settled"] = 0
+        return 0, [source]
+    if reverse is None:
+        reverse = graph.reversed()
+
+    dist = ({source: 0}, {target: 0})
+    pred = ({source: -1}, {target: -1})
+    done = (set(), set())
+    pqs = ([(0, source)], [(0, target)])
+    graphs = (graph, reverse)
+
+    best, meet = INF, None   # meet = (side, node, neigh) of the joining edge
+    settled = 0
+
+    while pqs[0] and pqs[1]:
+        if pqs[0][0][0] + pqs[1][0][0] >= best:
+            break
+
+        side = 0 if pqs[0][0][0] <= pqs[1][0][0] else 1
+        d, node = heapq.heappop(pqs[side])
+        if node in done[side]:
+            continue
+        done[side].add(node)
+        settled += 1
+
+        g = graphs[side]
+        here, there = dist[side], dist[1 - side]
+        a, b = g.offsets[node], g.offsets[node + 1]
+        for neigh, weight in zip(g.targets[a:b], g.weights[a:b]):
+            nd = d + weight
+            if nd < here.get(neigh, INF):
+                here[neigh] = nd
+                pred[side][neigh] = node
+                heapq.heappush(pqs[side], (nd, neigh))
+            if neigh in there and nd + there[neigh] < best:
+                best = nd + there[neigh]
+                meet = (side, node, neigh)
+
+    if stats is not None:
+        stats["settled"] = settled
+    if best == INF:
+        return INF, []
+
+    # Forward chain to the near end of the joining edge, backward chain after it
+    side, node, neigh = meet
+    head, tail = (node, neigh) if side == 0 else (neigh, node)
+    path = path_to_dict(pred[0], head)
+    path.append(tail)
+    while pred[1][path[-1]] != -1:
+        path.append(pred[1][path[-1]])
+    return best, path
+
+
+def astar_shortest_path(graph, source, target, heuristic, stats=None):
+    """
+    A* search. heuristic(u) must never overestimate the distance from u to
+    target (admissible). A node whose distance improves after it was
+    expanded is pushed again and expanded again, so the result is exact
+    even for inconsistent heuristics; with a consistent one (such as
+    Landmarks) every node is expanded at most once.
+    heuristic = lambda u: 0 gives plain Dijkstra.
+    Returns (distance, path); distance is the cost of the returned path.
+    """
+    dist = {source: 0}
+    pred = {source: -1}
+    pq = [(heuristic(source), 0, source)]
+    settled = 0
+    found = False
+
+    while pq:
+        _, d, node = heapq.heappop(pq)
+        if d > dist[node]:
+            continue  # reached more cheaply since this entry was pushed
+        settled += 1
+        if node == target:
+            found = True
+            break
+
+        a, b = graph.offsets[node], graph.offsets[node + 1]
+        for neigh, weight in zip(graph.targets[a:b], graph.weights[a:b]):
+            nd = d + weight
+            if nd < dist.get(neigh, INF):
+                dist[neigh] = nd
+                pred[neigh] = node
+                heapq.heappush(pq, (nd + heuristic(neigh), nd, neigh))
 
-v = int(input("Enter number of vertices: "))
-e = int(input("Enter number of edges: "))
+    if stats is not None:
+        stats["settled"] = settled
+    if not found:
+        return INF, []
+    return dist[target], path_to_dict(pred, target)
 
-# Randomly generate edges
-edges = []
-for _ in range(e):
-    u = random.randint(0, v-1)
-    w = random.randint(0, v-1)
-    while w == u:
+
+def path_to_dict(pred, target):
+    """path_to for predecessor dicts."""
+    path = [target]
+    while pred[path[-1]] != -1:
+        path.append(pred[path[-1]])
+    path.reverse()
+    return path
+
+
+class Landmarks:
+    """
+    ALT lower bounds from a few precomputed landmark distances.
+    By the triangle inequality, for every landmark L
+        d(u, t) >= d(L, t) - d(L, u)   and   d(u, t) >= d(u, L) - d(t, L)
+    and the largest of these bounds is an admissible, consistent heuristic.
+    Landmarks are picked greedily: each new one is the node farthest from
+    those already chosen.
+    """
+
+    def __init__(self, graph, count=4, seed=None):
+        rng = random.Random(seed)
+        reverse = graph.reversed()
+        self.landmarks = []
+        self.from_landmark = []   # d(L, u)
+        self.to_landmark = []     # d(u, L)
+
+        nearest = [INF] * graph.v
+        node = rng.randrange(graph.v)
+        for _ in range(min(count, graph.v)):
+            self.landmarks.append(node)
+            forward = shortest_paths(graph, node)[0]
+            backward = shortest_paths(reverse, node)[0] if graph.directed else forward
+            self.from_landmark.append(array('d', forward))
+            self.to_landmark.append(array('d', backward))
+
+            # Next landmark: reachable node farthest from all chosen ones
+            nearest = [min(a, b) for a, b in zip(nearest, forward)]
+            reachable = [(d, u) for u, d in enumerate(nearest) if d != INF]
+            node = max(reachable)[1] if reachable else rng.randrange(graph.v)
+
+    def heuristic(self, target):
+        """Return h(u), a lower bound on d(u, target)."""
+        pairs = []
+        for frm, to in zip(self.from_landmark, self.to_landmark):
+            if frm[target] != INF and to[target] != INF:
+                pairs.append((frm, to, frm[target], to[target]))
+
+        def h(u):
+            best = 0
+            for frm, to, frm_t, to_t in pairs:
+                if frm[u] == INF or to[u] == INF:
+                    continue
+                bound = max(frm_t - frm[u], to[u] - to_t)
+                if bound > best:
+                    best = bound
+            return best
+
+        return h
+
+
+# State of an all-pairs worker process, set up once by _apsp_init
+_apsp = {}
+
+
+def _apsp_init(v, names, kind, directed, path):
+    """Attach to the shared CSR arrays and the output file without copying."""
+    blocks = [shared_memory.SharedMemory(name=name) for name in names]
+    offsets = blocks[0].buf[:8 * (v + 1)].cast("q")
+    m = offsets[v]
+    targets = blocks[1].buf[:4 * m].cast("i")
+    weights = blocks[2].buf[:8 * m].cast(kind)
+    _apsp["blocks"] = blocks
+    _apsp["graph"] = CSRGraph(v, offsets, targets, weights, directed)
+    _apsp["out"] = np.load(path, mmap_mode="r+")
+
+
+def _apsp_rows(sources):
+    """Run Dijkstra from each source and write its row of the matrix."""
+    graph, out = _apsp["graph"], _apsp["out"]
+    for s in sources:
+        out[s] = shortest_paths(graph, s)[0]
+    out.flush()
+    return len(sources)
+
+
+def all_pairs_shortest_paths(graph, path, workers=None, chunk=64):
+    """
+    All-pairs distances by running Dijkstra from every source, which for
+    sparse graphs is far cheaper than O(n^3) Floyd-Warshall.
+
+    The v x v float64 result is a .npy file at `path` opened as a memory
+    map, so it may be larger than RAM. Sources are handed out in chunks to
+    a process pool; the CSR arrays are placed in shared memory once and
+    every worker reads them in place instead of receiving a pickled copy.
+    Returns the matrix opened read-only.
+    """
+    out = np.lib.format.open_memmap(path, mode="w+", dtype=np.float64, shape=(graph.v, graph.v))
+    del out  # header and size are on disk; workers reopen the file
+
+    workers = workers or os.cpu_count()
+    chunks = [range(i, min(i + chunk, graph.v)) for i in range(0, graph.v, chunk)]
+
+    if workers <= 1:
+        out = np.load(path, mmap_mode="r+")
+        for sources in chunks:
+            for s in sources:
+                out[s] = shortest_paths(graph, s)[0]
+        out.flush()
+        del out
+        return np.load(path, mmap_mode="r")
+
+    blocks = []
+    try:
+        for arr in (graph.offsets, graph.targets, graph.weights):
+            data = memoryview(arr).cast("B")
+            block = shared_memory.SharedMemory(create=True, size=max(1, len(data)))
+            block.buf[:len(data)] = data
+            blocks.append(block)
+
+        names = [block.name for block in blocks]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_apsp_init,
+                                 initargs=(graph.v, names, graph.weights.typecode, graph.directed, path)) as pool:
+            for _ in pool.map(_apsp_rows, chunks):
+                pass
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    return np.load(path, mmap_mode="r")
+
+
+def dijkstra(v, edges, source):
+    """Distances from source over an undirected edge list."""
+    graph = CSRGraph.from_edges(v, edges)
+    return shortest_paths(graph, source)[0]
+
+
+def random_edges(v, e):
+    """Randomly generate e undirected edges without self loops."""
+    edges = []
+    for _ in range(e):
+        u = random.randint(0, v-1)
         w = random.randint(0, v-1)
-    wt = random.randint(1, 20)
-    edges.append((u, w, wt))
+        while w == u:
+            w = random.randint(0, v-1)
+        wt = random.randint(1, 20)
+        edges.append((u, w, wt))
+    return edges
+
+
+# ---------- MAIN PROGRAM ----------
+
+if __name__ == "__main__":
+    v = int(input("Enter number of vertices: "))
+    e = int(input("Enter number of edges: "))
+
+    # Randomly generate edges
+    edges = random_edges(v, e)
 
-print("\nGenerated Edges (u, v, weight):")
-for edge in edges:
-    print(edge)
+    print("\nGenerated Edges (u, v, weight):")
+    for edge in edges:
+        print(edge)
 
-source = int(input("\nEnter source vertex: "))
+    source = int(input("\nEnter source vertex: "))
 
-distances = dijkstra(v, edges, source)
+    graph = CSRGraph.from_edges(v, edges)
+    distances, pred = shortest_paths(graph, source)
 
-print("\nShortest distances from source", source, ":")
-for i, d in enumerate(distances):
-    print(f"Vertex {i} -> {d}")
+    print("\nShortest distances from source", source, ":")
+    for i, d in enumerate(distances):
+        if d == INF:
+            print(f"Vertex {i} -> {d}")
+        else:
+            print(f"Vertex {i} -> {d:g} | Path: {' -> '.join(map(str, path_to(pred, i)))}")
@@ -0,0 +1,49 @@
+# Point-to-point shortest path benchmark for the searches in Task2.py
+
+import random
+import time
+
+from Task2 import (CSRGraph, Landmarks, astar_shortest_path, bidirectional_shortest_path,
+                   random_edges, shortest_paths)
+
+
+def measure(search, pairs):
+    """Average settled nodes and latency (ms) of search(source, target)."""
+    settled = 0
+    start = time.perf_counter()
+    for s, t in pairs:
+        stats = {}
+        search(s, t, stats)
+        settled += stats["settled"]
+    elapsed = time.perf_counter() - start
+    return settled / len(pairs), 1000 * elapsed / len(pairs)
+
+
+def run(v, e, queries=50, landmarks=8, seed=0):
+    random.seed(seed)
+    edges = random_edges(v, e)
+    graph = CSRGraph.from_edges(v, edges)
+    pairs = [(random.randrange(v), random.randrange(v)) for _ in range(queries)]
+
+    start = time.perf_counter()
+    alt = Landmarks(graph, landmarks, seed=seed)
+    prep = time.perf_counter() - start
+    heuristics = {t: alt.heuristic(t) for _, t in pairs}
+
+    searches = {
+        "full dijkstra": lambda s, t, st: shortest_paths(graph, s, stats=st),
+        "early exit": lambda s, t, st: shortest_paths(graph, s, t, stats=st),
+        "bidirectional": lambda s, t, st: bidirectional_shortest_path(graph, s, t, stats=st),
+        "A* (ALT)": lambda s, t, st: astar_shortest_path(graph, s, t, heuristics[t], stats=st),
+    }
+
+    print(f"\nV = {v}, E = {e}, {queries} queries, ALT preprocessing {prep:.2f} s")
+    print(f"{'search':<16} {'settled':>10} {'ms/query':>10}")
+    for name, search in searches.items():
+        settled, ms = measure(search, pairs)
+        print(f"{name:<16} {settled:>10.0f} {ms:>10.2f}")
+
+
+if __name__ == "__main__":
+    for v, e in [(10_000, 30_000), (100_000, 300_000)]:
+        run(v, e)
@@ -1,70 +1,396 @@
+import heapq
 import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import Value
 
-def tsp_branch_and_bound(dist):
+INF = math.inf
+
+
+def _edge_weights(dist):
+    """Copy of dist with missing edges (0 off the diagonal) set to inf."""
     n = len(dist)
+    return [[dist[i][j] if i != j and dist[i][j] > 0 else INF for j in range(n)] for i in range(n)]
+
+
+def tour_cost(w, tour):
+    return sum(w[a][b] for a, b in zip(tour, tour[1:]))
+
+
+def nearest_neighbour_tour(w):
+    """Greedy tour from city 0; None if it runs into a dead end."""
+    n = len(w)
+    tour = [0]
+    visited = [False] * n
+    visited[0] = True
+    for _ in range(n - 1):
+        curr = tour[-1]
+        nxt = min((j for j in range(n) if not visited[j]), key=lambda j: w[curr][j])
+        if w[curr][nxt] == INF:
+            return None
+        visited[nxt] = True
+        tour.append(nxt)
+    if w[tour[-1]][0] == INF:
+        return None
+    tour.append(0)
+    return tour
+
+
+def two_opt(w, tour):
+    """
+    Reverse segments tour[i..j] while that shortens the tour.
+    Prefix sums of the edge costs in both directions make each move O(1)
+    to evaluate, so this also works for asymmetric matrices.
+    """
+    tour = tour[:]
+    n = len(tour) - 1
+    improved = True
+    while improved:
+        improved = False
+        fwd = [0] * (n + 1)   # fwd[k] = cost of tour[0..k] walked forwards
+        bwd = [0] * (n + 1)   # bwd[k] = cost of tour[0..k] walked backwards
+        for k in range(n):
+            fwd[k + 1] = fwd[k] + w[tour[k]][tour[k + 1]]
+            bwd[k + 1] = bwd[k] + w[tour[k + 1]][tour[k]]
+
+        for i in range(1, n - 1):
+            for j in range(i + 1, n):
+                old = fwd[j + 1] - fwd[i - 1]
+                new = w[tour[i - 1]][tour[j]] + (bwd[j] - bwd[i]) + w[tour[i]][tour[j + 1]]
+                if new < old:
+                    tour[i:j + 1] = reversed(tour[i:j + 1])
+                    improved = True
+                    break
+            if improved:
+                break
+    return tour
+
+
+def _bound_terms(w):
+    """
+    Per-city lower-bound terms for the cities a partial tour still has to
+    enter and leave.
+
+    Symmetric matrix: every city lies on two tour edges, each shared by two
+    cities, so an unvisited city contributes (min1 + min2) / 2 and each
+    end of the current path (which needs one more edge) contributes min1 / 2.
+    Asymmetric matrix: every city still to be left needs an outgoing edge
+    and every city still to be entered needs an incoming one; the bound is
+    the larger of the two sums.
+    Returns (symmetric, t1, t2, end) with t1/t2 summed over unvisited cities.
+    """
+    n = len(w)
+    symmetric = all(w[i][j] == w[j][i] for i in range(n) for j in range(i))
+
+    if symmetric:
+        two = [sorted(row)[:2] + [INF, INF] for row in w]
+        need = [(a + b) / 2 for a, b, *_ in two]
+        end = [a / 2 for a, *_ in two]
+        return True, need, need, end
+
+    min_out = [min(row) for row in w]
+    min_in = [min(w[i][j] for i in range(n)) for j in range(n)]
+    return False, min_out, min_in, None
 
-    # Precompute the minimum outgoing edge from each city (for lower bound)
-    min_edge = []
-    for i in range(n):
-        m = math.inf
-        for j in range(n):
-            if i != j and dist[i][j] > 0:
-                m = min(m, dist[i][j])
-        min_edge.append(0 if m == math.inf else m)
 
-    best_cost = math.inf
-    best_path = []
+class _Bound:
+    """Lower bound of a partial tour, updated in O(1) per added city."""
 
-    def dfs(curr_city, visited, curr_cost, path):
+    def __init__(self, w):
+        self.symmetric, self.t1, self.t2, self.end = _bound_terms(w)
+        self.w = w
+
+    def start(self):
+        """Sums over every city except the start city 0."""
+        return sum(self.t1[1:]), sum(self.t2[1:])
+
+    def value(self, cost, curr, s1, s2):
+        if self.symmetric:
+            return cost + s1 + self.end[0] + self.end[curr]
+        # cities left to leave: unvisited + curr; left to enter: unvisited + 0
+        return cost + max(s1 + self.t1[curr], s2 + self.t2[0])
+
+
+def _incumbent(w):
+    """Nearest neighbour + 2-opt tour used to seed best_cost."""
+    tour = nearest_neighbour_tour(w)
+    if tour is None:
+        return INF, []
+    tour = two_opt(w, tour)
+    return tour_cost(w, tour), tour
+
+
+def _new_stats():
+    """
+    Search statistics:
+        expanded -> nodes whose children were generated
+        pruned   -> children cut off by the bound
+        first    -> seconds until the first tour was known
+        best     -> seconds until the final best tour was found
+    """
+    return {"expanded": 0, "pruned": 0, "first": None, "best": None}
+
+
+def _record(stats, start):
+    """Note the time of a new incumbent."""
+    now = time.perf_counter() - start
+    if stats["first"] is None:
+        stats["first"] = now
+    stats["best"] = now
+
+
+def tsp_branch_and_bound(dist, mode="dfs", stats=None, workers=None, split_depth=2):
+    """
+    Exact TSP by branch and bound, starting and ending at city 0.
+    mode="dfs": depth-first search on a single mutable path stack.
+    mode="best-first": always expand the open node with the smallest bound.
+    mode="parallel": DFS subtrees below split_depth shared out to a pool of
+                     `workers` processes (see _parallel).
+    All modes seed the incumbent with a nearest neighbour + 2-opt tour, try
+    the nearest cities first and keep the lower bound incrementally.
+    If a stats dict is given it is filled as described in _new_stats.
+    Returns (min cost, route).
+    """
+    start = time.perf_counter()
+    found = _new_stats()
+
+    n = len(dist)
+    if n == 1:
+        _record(found, start)
+        if stats is not None:
+            stats.update(found)
+        return dist[0][0], [0, 0]
+
+    w = _edge_weights(dist)
+    order = _neighbour_order(w)
+    bound = _Bound(w)
+    best_cost, best_path = _incumbent(w)
+    if best_path:
+        _record(found, start)
+
+    if mode == "dfs":
+        best_cost, best_path = _dfs(w, order, bound, best_cost, best_path, found, start)
+    elif mode == "best-first":
+        best_cost, best_path = _best_first(w, order, bound, best_cost, best_path, found, start)
+    elif mode == "parallel":
+        best_cost, best_path = _parallel(w, order, bound, best_cost, best_path, found, start,
+                                         workers, split_depth)
+    else:
+        raise ValueError(f"unknown mode: {mode}")
+
+    if stats is not None:
+        stats.update(found)
+    return best_cost, best_path
+
+
+def _neighbour_order(w):
+    n = len(w)
+    return [sorted(range(n), key=lambda j: w[i][j]) for i in range(n)]
+
+
+def _dfs(w, order, bound, best_cost, best_path, stats, start, prefix=(0,), incumbent=None):
+    """
+    Depth-first search below `prefix`.
+    In parallel mode `incumbent` is a shared multiprocessing.Value holding
+    the best cost any worker has found; it is read on every node so all
+    workers prune with the global best, and written under its lock.
+    """
+    n = len(w)
+    t1, t2 = bound.t1, bound.t2
+    path = list(prefix)
+    visited = [False] * n
+    for city in path:
+        visited[city] = True
+    shared = incumbent.get_obj() if incumbent is not None else None
+
+    def dfs(curr, curr_cost, s1, s2):
         nonlocal best_cost, best_path
 
         # If all cities visited, close the tour by returning to start (0)
         if len(path) == n:
-            tour_cost = curr_cost + dist[curr_city][0]
+            tour_cost = curr_cost + w[curr][0]
             if tour_cost < best_cost:
                 best_cost = tour_cost
                 best_path = path + [0]
+                _record(stats, start)
+                if incumbent is not None:
+                    with incumbent.get_lock():
+                        if tour_cost < shared.value:
+                            shared.value = tour_cost
             return
 
-        # Try all next cities
-        for next_city in range(n):
-            if not visited[next_city] and dist[curr_city][next_city] > 0:
-                new_cost = curr_cost + dist[curr_city][next_city]
+        stats["expanded"] += 1
+        for next_city in order[curr]:
+            if visited[next_city]:
+                continue
+            edge = w[curr][next_city]
+            if edge == INF:
+                break  # neighbours are sorted, the rest are missing too
+
+            new_cost = curr_cost + edge
+            n1, n2 = s1 - t1[next_city], s2 - t2[next_city]
+            limit = best_cost if shared is None else min(best_cost, shared.value)
+            if bound.value(new_cost, next_city, n1, n2) >= limit:
+                stats["pruned"] += 1
+                continue
+
+            visited[next_city] = True
+            path.append(next_city)
+            dfs(next_city, new_cost, n1, n2)
+            path.pop()  # BACKTRACK
+            visited[next_city] = False
+
+    s1, s2 = bound.start()
+    for city in path[1:]:
+        s1, s2 = s1 - t1[city], s2 - t2[city]
+    dfs(path[-1], tour_cost(w, path), s1, s2)
+    return best_cost, best_path
+
+
+def _best_first(w, order, bound, best_cost, best_path, stats, start):
+    """
+    Open nodes are (bound, tie, cost, city, visited mask, s1, s2, chain)
+    where chain = (city, parent chain) shares the path prefix between nodes.
+    """
+    n = len(w)
+    full = (1 << n) - 1
+    t1, t2 = bound.t1, bound.t2
+    s1, s2 = bound.start()
+    tie = 0
+    pq = [(bound.value(0, 0, s1, s2), tie, 0, 0, 1, s1, s2, (0, None))]
+
+    while pq:
+        b, _, cost, curr, mask, s1, s2, chain = heapq.heappop(pq)
+        if b >= best_cost:
+            stats["pruned"] += len(pq) + 1
+            break  # every other open node has a bound at least this large
+
+        stats["expanded"] += 1
+        for next_city in order[curr]:
+            if mask >> next_city & 1:
+                continue
+            edge = w[curr][next_city]
+            if edge == INF:
+                break
+
+            new_cost = cost + edge
+            new_mask = mask | 1 << next_city
+            if new_mask == full:
+                tour_cost = new_cost + w[next_city][0]
+                if tour_cost < best_cost:
+                    best_cost = tour_cost
+                    best_path = _chain_path((next_city, chain)) + [0]
+                    _record(stats, start)
+                continue
+
+            n1, n2 = s1 - t1[next_city], s2 - t2[next_city]
+            child = bound.value(new_cost, next_city, n1, n2)
+            if child < best_cost:
+                tie += 1
+                heapq.heappush(pq, (child, tie, new_cost, next_city, new_mask, n1, n2, (next_city, chain)))
+            else:
+                stats["pruned"] += 1
+
+    return best_cost, best_path
 
-                # --- Lower bound estimation ---
-                remaining_bound = 0
-                for k in range(n):
-                    if not visited[k] and k != next_city:
-                        remaining_bound += min_edge[k]
-                bound = new_cost + remaining_bound
 
-                # Prune if bound already worse than best known solution
-                if bound >= best_cost:
+def _split(w, order, bound, best_cost, depth):
+    """
+    Open prefixes [0, c1, .., c_depth] that survive the bound, most
+    promising (smallest bound) first.
+    """
+    n = len(w)
+    t1, t2 = bound.t1, bound.t2
+    depth = max(0, min(depth, n - 2))  # never hand out complete tours
+
+    frontier = [(0, (0,), *bound.start())]
+    for _ in range(depth):
+        grown = []
+        for cost, path, s1, s2 in frontier:
+            curr = path[-1]
+            for next_city in order[curr]:
+                if next_city in path:
                     continue
+                edge = w[curr][next_city]
+                if edge == INF:
+                    break
+                n1, n2 = s1 - t1[next_city], s2 - t2[next_city]
+                if bound.value(cost + edge, next_city, n1, n2) < best_cost:
+                    grown.append((cost + edge, path + (next_city,), n1, n2))
+        frontier = grown
 
-                visited[next_city] = True
-                dfs(next_city, visited, new_cost, path + [next_city])
-                visited[next_city] = False
+    frontier.sort(key=lambda node: bound.value(node[0], node[1][-1], node[2], node[3]))
+    return [path for _, path, _, _ in frontier]
 
-    # Start from city 0
-    visited = [False] * n
-    visited[0] = True
-    dfs(0, visited, 0, [0])
+
+# State of a branch-and-bound worker process, set up once by _bb_init
+_bb = {}
+
+
+def _bb_init(w, incumbent, start):
+    _bb.update(w=w, order=_neighbour_order(w), bound=_Bound(w), incumbent=incumbent, start=start)
+
+
+def _bb_task(prefix):
+    """Worker: exhaust the subtree below prefix against the shared incumbent."""
+    stats = _new_stats()
+    incumbent = _bb["incumbent"]
+    cost, path = _dfs(_bb["w"], _bb["order"], _bb["bound"], incumbent.get_obj().value, [],
+                      stats, _bb["start"], prefix, incumbent)
+    return cost, path, stats
+
+
+def _parallel(w, order, bound, best_cost, best_path, stats, start, workers, split_depth):
+    """
+    Parallel DFS. The tree is cut at split_depth into many small subtree
+    tasks, ordered by bound. Pool workers pull the next task as soon as
+    they finish one, so idle cores keep taking work. Every worker prunes
+    against a shared incumbent Value and publishes improvements to it.
+    Worker times are measured from the same start (perf_counter is
+    system-wide on the platforms we run on).
+    """
+    prefixes = _split(w, order, bound, best_cost, split_depth)
+    incumbent = Value("d", best_cost)
+    stats["tasks"] = len(prefixes)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_bb_init,
+                             initargs=(w, incumbent, start)) as pool:
+        for cost, path, task_stats in pool.map(_bb_task, prefixes):
+            stats["expanded"] += task_stats["expanded"]
+            stats["pruned"] += task_stats["pruned"]
+            if task_stats["first"] is not None:
+                if stats["first"] is None or task_stats["first"] < stats["first"]:
+                    stats["first"] = task_stats["first"]
+            if path and cost < best_cost:
+                best_cost, best_path = cost, path
+                stats["best"] = task_stats["best"]
 
     return best_cost, best_path
 
 
+def _chain_path(chain):
+    path = []
+    while chain is not None:
+        path.append(chain[0])
+        chain = chain[1]
+    path.reverse()
+    return path
+
+
 # ------------ MAIN PROGRAM ------------
 
-n = int(input("Enter number of cities: "))
+if __name__ == "__main__":
+    n = int(input("Enter number of cities: "))
 
-print("\nEnter distance matrix (use 0 for no self-distance):")
-dist = []
-for i in range(n):
-    row = list(map(int, input(f"Row {i} (space separated): ").split()))
-    dist.append(row)
+    print("\nEnter distance matrix (use 0 for no self-distance):")
+    dist = []
+    for i in range(n):
+        row = list(map(int, input(f"Row {i} (space separated): ").split()))
+        dist.append(row)
 
-min_cost, route = tsp_branch_and_bound(dist)
+    stats = {}
+    min_cost, route = tsp_branch_and_bound(dist, stats=stats)
 
-print("\nShortest route (tour):", " -> ".join(map(str, route)))
-print("Minimum cost:", min_cost)
+    print("\nShortest route (tour):", " -> ".join(map(str, route)))
+    print("Minimum cost:", min_cost)
+    print(f"Nodes expanded: {stats['expanded']}, pruned: {stats['pruned']}")
@@ -1,58 +1,299 @@
-def is_safe(board, row, col, N):
-    # Check this row on left side
-    for c in range(col):
-        if board[row][c] == 1:
-            return False
-
-    # Check upper-left diagonal
-    r, c = row, col
-    while r >= 0 and c >= 0:
-        if board[r][c] == 1:
-            return False
-        r -= 1
-        c -= 1
-
-    # Check lower-left diagonal
-    r, c = row, col
-    while r < N and c >= 0:
-        if board[r][c] == 1:
-            return False
-        r += 1
-        c -= 1
-
-    return True
-
-
-def solve_nqueens(board, col, N, solutions):
-    if col == N:
-        # Deep copy the board
-        solution = [row[:] for row in board]
-        solutions.append(solution)
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Queens are placed column by column. A solution is stored as a tuple
+# `sol` where sol[col] is the row of the queen in that column.
+#
+# Occupancy is tracked with three integer bitmasks instead of a 2D board:
+#   rows  -> rows already holding a queen
+#   diag1 -> squares attacked along "\" diagonals in the next column
+#   diag2 -> squares attacked along "/" diagonals in the next column
+# so finding the free squares of a column is a single AND/OR.
+
+
+def _first_column_tasks(N):
+    """
+    First-column rows to search and how many solutions each one stands for.
+    A board and its mirror image (row r <-> row N-1-r) have the same number
+    of solutions, so only the top half is searched and counted twice.
+    """
+    tasks = [(row, 2) for row in range(N // 2)]
+    if N % 2 == 1:
+        tasks.append((N // 2, 1))  # middle row is its own mirror
+    return tasks
+
+
+def _count(full, rows, diag1, diag2):
+    """Count completions of a partial placement without building boards."""
+    if rows == full:
+        return 1
+
+    total = 0
+    free = full & ~(rows | diag1 | diag2)
+    while free:
+        bit = free & -free  # lowest free row
+        free ^= bit
+        total += _count(full, rows | bit, ((diag1 | bit) << 1) & full, (diag2 | bit) >> 1)
+    return total
+
+
+def _count_from_row(N, row):
+    """Count all solutions whose first-column queen sits on `row`."""
+    full = (1 << N) - 1
+    bit = 1 << row
+    return _count(full, bit, (bit << 1) & full, bit >> 1)
+
+
+def _search(full, rows, diag1, diag2, placed):
+    """Yield every completion of `placed` as a tuple of row indices."""
+    if rows == full:
+        yield tuple(placed)
         return
 
-    for row in range(N):
-        if is_safe(board, row, col, N):
-            board[row][col] = 1
-            solve_nqueens(board, col + 1, N, solutions)
-            board[row][col] = 0  # BACKTRACK
+    free = full & ~(rows | diag1 | diag2)
+    while free:
+        bit = free & -free
+        free ^= bit
+        placed.append(bit.bit_length() - 1)
+        yield from _search(full, rows | bit, ((diag1 | bit) << 1) & full, (diag2 | bit) >> 1, placed)
+        placed.pop()  # BACKTRACK
 
 
-def print_solutions(solutions, N):
-    print(f"\nTotal Solutions Found: {len(solutions)}\n")
+def solve_nqueens(N):
+    """
+    Generate all solutions one at a time as column -> row tuples.
+    Only the top half of the first column is searched; each solution found
+    there is yielded together with its mirror image.
+    """
+    if N < 1:
+        return
+
+    full = (1 << N) - 1
+    for row, weight in _first_column_tasks(N):
+        bit = 1 << row
+        for sol in _search(full, bit, (bit << 1) & full, bit >> 1, [row]):
+            yield sol
+            if weight == 2:
+                yield tuple(N - 1 - r for r in sol)
+
+
+def count_nqueens(N, workers=None):
+    """
+    Count solutions without materialising any board.
+    With workers > 1 the first-column subtrees are spread over a process pool.
+    """
+    if N < 1:
+        return 0
+
+    tasks = _first_column_tasks(N)
+    if workers is None or workers <= 1:
+        return sum(weight * _count_from_row(N, row) for row, weight in tasks)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        counts = pool.map(_count_from_row, [N] * len(tasks), [row for row, _ in tasks])
+        return sum(weight * c for (_, weight), c in zip(tasks, counts))
+
+
+def _masks(placed, full):
+    """Rebuild the (rows, diag1, diag2) masks for a column -> row placement."""
+    rows = diag1 = diag2 = 0
+    for row in placed:
+        bit = 1 << row
+        if (rows | diag1 | diag2) & bit:
+            raise ValueError(f"placement {placed} is not safe")
+        rows |= bit
+        diag1 = ((diag1 | bit) << 1) & full
+        diag2 = (diag2 | bit) >> 1
+    return rows, diag1, diag2
+
+
+def search_prefixes(N, depth):
+    """
+    All safe placements of the first `depth` columns, in search order.
+    The first column only uses the top half (plus the middle row for odd N);
+    the bottom half is covered by mirroring, as in solve_nqueens.
+    """
+    full = (1 << N) - 1
+    depth = max(1, min(depth, N))
+    prefixes = []
+
+    def extend(rows, diag1, diag2, placed):
+        if len(placed) == depth:
+            prefixes.append(tuple(placed))
+            return
+        free = full & ~(rows | diag1 | diag2)
+        while free:
+            bit = free & -free
+            free ^= bit
+            placed.append(bit.bit_length() - 1)
+            extend(rows | bit, ((diag1 | bit) << 1) & full, (diag2 | bit) >> 1, placed)
+            placed.pop()
+
+    for row, _ in _first_column_tasks(N):
+        bit = 1 << row
+        extend(bit, (bit << 1) & full, bit >> 1, [row])
+    return prefixes
+
 
+def shard_prefixes(N, depth, shard, num_shards):
+    """
+    Prefixes handled by shard number `shard` out of `num_shards`.
+    Prefixes are dealt round-robin so shards get similar amounts of work,
+    and no two shards share a prefix, so their outputs are disjoint.
+    """
+    if not 0 <= shard < num_shards:
+        raise ValueError("shard must be in range(num_shards)")
+    return search_prefixes(N, depth)[shard::num_shards]
+
+
+class NQueensSearch:
+    """
+    Resumable N-Queens enumeration.
+
+    Iterating yields solutions (column -> row tuples) as soon as they are
+    found. The search runs on an explicit stack, so at any point between two
+    solutions checkpoint() can describe the whole frontier:
+        prefixes    -> the prefixes this search is responsible for
+        next_prefix -> index of the next prefix to start
+        placed      -> queens placed so far in the current subtree
+        free        -> rows still to try in every open column of the subtree
+        pending     -> mirror image still to be yielded, if any
+        found       -> number of solutions yielded so far
+    """
+
+    def __init__(self, N, prefixes=None):
+        self.N = N
+        self.full = (1 << N) - 1
+        if prefixes is None:
+            prefixes = search_prefixes(N, 1) if N > 0 else []
+        self.prefixes = [tuple(p) for p in prefixes]
+        self.next_prefix = 0
+        self.placed = []
+        self.stack = []  # [rows, diag1, diag2, free] for each open column
+        self.pending = None
+        self.found = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.pending is not None:
+            sol, self.pending = self.pending, None
+            self.found += 1
+            return sol
+
+        full = self.full
+        while True:
+            if not self.stack:
+                # Current subtree exhausted: start on the next prefix
+                if self.next_prefix == len(self.prefixes):
+                    raise StopIteration
+                prefix = self.prefixes[self.next_prefix]
+                self.next_prefix += 1
+                rows, diag1, diag2 = _masks(prefix, full)
+                self.placed = list(prefix)
+                if rows == full:
+                    return self._emit(tuple(prefix))
+                self.stack.append([rows, diag1, diag2, full & ~(rows | diag1 | diag2)])
+                continue
+
+            top = self.stack[-1]
+            if not top[3]:
+                self.stack.pop()
+                if self.stack:
+                    self.placed.pop()  # BACKTRACK
+                continue
+
+            rows, diag1, diag2, free = top
+            bit = free & -free
+            top[3] = free ^ bit
+            row = bit.bit_length() - 1
+
+            rows |= bit
+            if rows == full:
+                return self._emit(tuple(self.placed) + (row,))
+
+            diag1 = ((diag1 | bit) << 1) & full
+            diag2 = (diag2 | bit) >> 1
+            self.placed.append(row)
+            self.stack.append([rows, diag1, diag2, full & ~(rows | diag1 | diag2)])
+
+    def _emit(self, sol):
+        first = sol[0]
+        if first != self.N - 1 - first:
+            self.pending = tuple(self.N - 1 - r for r in sol)
+        self.found += 1
+        return sol
+
+    def checkpoint(self):
+        """Snapshot of the search frontier as a JSON-friendly dict."""
+        return {
+            "N": self.N,
+            "prefixes": [list(p) for p in self.prefixes],
+            "next_prefix": self.next_prefix,
+            "placed": list(self.placed),
+            "free": [frame[3] for frame in self.stack],
+            "pending": list(self.pending) if self.pending is not None else None,
+            "found": self.found,
+        }
+
+    @classmethod
+    def from_checkpoint(cls, state):
+        """Rebuild a search from a checkpoint() dict."""
+        search = cls(state["N"], state["prefixes"])
+        search.next_prefix = state["next_prefix"]
+        search.placed = list(state["placed"])
+        search.found = state["found"]
+        if state["pending"] is not None:
+            search.pending = tuple(state["pending"])
+
+        # Masks are recomputed from the placement; only the free rows are stored
+        free = state["free"]
+        if free:
+            base = len(search.placed) - (len(free) - 1)
+            for depth, remaining in enumerate(free):
+                rows, diag1, diag2 = _masks(search.placed[:base + depth], search.full)
+                search.stack.append([rows, diag1, diag2, remaining])
+        return search
+
+    def save(self, path):
+        """Write the checkpoint to `path`, replacing it atomically."""
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.checkpoint(), f)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            return cls.from_checkpoint(json.load(f))
+
+
+def board_from_solution(sol):
+    """Expand a column -> row tuple into the 0/1 board layout."""
+    N = len(sol)
+    board = [[0] * N for _ in range(N)]
+    for col, row in enumerate(sol):
+        board[row][col] = 1
+    return board
+
+
+def print_solutions(solutions, N):
+    """Print solutions as they arrive from the generator, then the total."""
+    total = 0
     for idx, sol in enumerate(solutions, 1):
-        print(f"Solution {idx}:")
-        for row in sol:
+        print(f"\nSolution {idx}:")
+        for row in board_from_solution(sol):
             print(row)
-        print()
+        total = idx
 
+    print(f"\nTotal Solutions Found: {total}\n")
 
-# ---------- MAIN PROGRAM ----------
 
-N = int(input("Enter value of N for N-Queens: "))
+# ---------- MAIN PROGRAM ----------
 
-board = [[0] * N for _ in range(N)]
-solutions = []
+if __name__ == "__main__":
+    N = int(input("Enter value of N for N-Queens: "))
 
-solve_nqueens(board, 0, N, solutions)
-print_solutions(solutions, N)
+    print_solutions(solve_nqueens(N), N)
@@ -0,0 +1,42 @@
+# Benchmark of the Floyd-Warshall engines in floydWarshall.py
+
+import random
+import time
+
+from floydWarshall import floyd_warshall_blocked, floyd_warshall_np, floyd_warshall_with_path
+
+INF = float('inf')
+
+# The pure Python triple loop is O(n^3); skip it above this size
+PYTHON_LIMIT = 300
+
+
+def random_matrix(n, density=0.1, seed=0):
+    random.seed(seed)
+    return [[0 if i == j else (random.randint(1, 100) if random.random() < density else INF)
+             for j in range(n)] for i in range(n)]
+
+
+def timed(fn, A):
+    start = time.perf_counter()
+    fn(A)
+    return time.perf_counter() - start
+
+
+def run(sizes):
+    print(f"{'n':>6} {'python (s)':>12} {'numpy (s)':>12} {'blocked (s)':>12} {'speedup':>9}")
+
+    for n in sizes:
+        A = random_matrix(n)
+        t_np = timed(floyd_warshall_np, A)
+        t_blk = timed(floyd_warshall_blocked, A)
+
+        if n <= PYTHON_LIMIT:
+            t_py = timed(floyd_warshall_with_path, A)
+            print(f"{n:>6} {t_py:12.3f} {t_np:12.3f} {t_blk:12.3f} {t_py / min(t_np, t_blk):8.0f}x")
+        else:
+            print(f"{n:>6} {'-':>12} {t_np:12.3f} {t_blk:12.3f} {'-':>9}")
+
+
+if __name__ == "__main__":
+    run([100, 200, 300, 500, 1000, 2000])
@@ -1,5 +1,10 @@
 # Floyd Warshall Algorithm in Python (with path reconstruction)
 
+import mmap
+import struct
+
+import numpy as np
+
 def floyd_warshall_with_path(A):
     n = len(A)
     INF = float('inf')
@@ -19,17 +24,255 @@ def floyd_warshall_with_path(A):
     return dist, next_node
 
 
+def _successors(dist):
+    """Initial successor matrix: j where an edge i -> j exists, else -1."""
+    n = len(dist)
+    nxt = np.broadcast_to(np.arange(n, dtype=np.int32), (n, n)).copy()
+    nxt[np.isinf(dist)] = -1
+    return nxt
+
+
+def floyd_warshall_np(A):
+    """
+    NumPy Floyd-Warshall.
+    For each k the whole matrix is relaxed at once by broadcasting column k
+    against row k. Successors are kept in an int32 array with -1 for
+    "no path", instead of a list of lists of None/int.
+    Returns dist (float64) and next_node (int32).
+    """
+    dist = np.array(A, dtype=np.float64)
+    nxt = _successors(dist)
+    n = len(dist)
+
+    cand = np.empty_like(dist)
+    better = np.empty(dist.shape, dtype=bool)
+    for k in range(n):
+        np.add(dist[:, k, None], dist[None, k, :], out=cand)
+        np.less(cand, dist, out=better)
+        np.copyto(dist, cand, where=better)
+        np.copyto(nxt, nxt[:, k, None], where=better)
+
+    return dist, nxt
+
+
+def _relax(dist, nxt, rows, cols, ks):
+    """Relax the tile dist[rows, cols] through every k in ks, in order."""
+    tile = dist[rows, cols]
+    tile_next = nxt[rows, cols]
+    cand = np.empty_like(tile)
+    better = np.empty(tile.shape, dtype=bool)
+    for k in range(ks.start, ks.stop):
+        np.add(dist[rows, k, None], dist[None, k, cols], out=cand)
+        np.less(cand, tile, out=better)
+        np.copyto(tile, cand, where=better)
+        np.copyto(tile_next, nxt[rows, k, None], where=better)
+
+
+def floyd_warshall_blocked(A, block=128):
+    """
+    Cache-blocked (tiled) Floyd-Warshall for large n.
+    The k loop is split into blocks K. For each K:
+      1. the diagonal tile (K, K) is closed over k in K,
+      2. the row panel (K, *) and column panel (*, K) are relaxed through K,
+      3. every other tile (I, J) is relaxed using the final (I, K) and (K, J).
+    Each step only touches block x block tiles, which stay in cache.
+    Returns the same dist / next_node as floyd_warshall_np.
+    """
+    dist = np.array(A, dtype=np.float64)
+    nxt = _successors(dist)
+    n = len(dist)
+    blocks = [slice(b, min(b + block, n)) for b in range(0, n, block)]
+
+    for K in blocks:
+        _relax(dist, nxt, K, K, K)
+        for J in blocks:
+            if J != K:
+                _relax(dist, nxt, K, J, K)
+                _relax(dist, nxt, J, K, K)
+        for I in blocks:
+            if I == K:
+                continue
+            for J in blocks:
+                if J != K:
+                    _relax(dist, nxt, I, J, K)
+
+    return dist, nxt
+
+
+class AllPairsIndex:
+    """
+    All-pairs distances and successors kept up to date under edge changes.
+
+    set_edge(u, v, w) handles the two cases differently:
+      - decrease: any pair that improves must now use u -> v, so one
+        broadcast of dist[:, u] + w + dist[v, :] updates everything, O(n^2);
+      - increase: only pairs whose stored path runs through u -> v can get
+        worse. Those lie in rows i with dist[i][u] + dist[u][j] == dist[i][j]
+        for some j whose path from u starts with v; only those rows are
+        recomputed, each with an O(n^2) dense Dijkstra.
+    Negative edge weights are fine as long as there is no negative cycle:
+    before an increase, h[j] = min over i of dist[i][j] is a potential with
+    w(x, y) + h[x] - h[y] >= 0, and it stays valid when a weight goes up,
+    so Dijkstra runs on those reweighted edges (as in Johnson's algorithm).
+    construct_path works against self.next_node as usual.
+    """
+
+    def __init__(self, A, engine=floyd_warshall_np):
+        self.edges = np.array(A, dtype=np.float64)
+        self.dist, self.next_node = engine(A)
+
+    def distance(self, u, v):
+        return self.dist[u][v]
+
+    def path(self, u, v):
+        return construct_path(u, v, self.next_node)
+
+    def set_edge(self, u, v, weight):
+        old = self.edges[u][v]
+        self.edges[u][v] = weight
+        if weight < old:
+            self._decrease(u, v, weight)
+        elif weight > old:
+            self._increase(u, v)
+
+    def _decrease(self, u, v, weight):
+        dist, nxt = self.dist, self.next_node
+        cand = dist[:, u, None] + weight + dist[None, v, :]
+        better = cand < dist
+
+        # New paths go i -> ... -> u -> v -> ... -> j
+        first = nxt[:, u].copy()
+        first[u] = v
+        np.copyto(dist, cand, where=better)
+        np.copyto(nxt, first[:, None], where=better)
+
+    def _increase(self, u, v):
+        dist, nxt = self.dist, self.next_node
+        through = nxt[u] == v
+        through[u] = False
+        if not through.any():
+            return
+
+        via_u = dist[:, u, None] + dist[None, u, through]
+        uses = np.isfinite(via_u) & np.isclose(via_u, dist[:, through])
+        rows = np.flatnonzero(uses.any(axis=1))
+        if not len(rows):
+            return
+
+        # Potential from the old distances; the reweighted edges are >= 0
+        h = dist.min(axis=0)
+        reduced = self.edges + h[:, None] - h[None, :]
+        for i in rows:
+            self._recompute_row(i, reduced, h)
+
+    def _recompute_row(self, src, edges, h):
+        """Dense Dijkstra from src over the reweighted edges; h undoes the reweighting."""
+        n = len(edges)
+        dist = np.full(n, np.inf)
+        first = np.full(n, -1, dtype=np.int32)   # first hop on the path from src
+        done = np.zeros(n, dtype=bool)
+        dist[src] = 0
+        first[src] = src
+
+        for _ in range(n):
+            x = int(np.argmin(np.where(done, np.inf, dist)))
+            if done[x] or dist[x] == np.inf:
+                break
+            done[x] = True
+
+            cand = dist[x] + edges[x]
+            better = (cand < dist) & ~done
+            dist[better] = cand[better]
+            first[better] = np.flatnonzero(better) if x == src else first[x]
+
+        self.dist[src] = dist - h[src] + h
+        self.next_node[src] = first
+
+
 def construct_path(u, v, next_node):
-    """Reconstruct the shortest path from u to v."""
-    if next_node[u][v] is None:
+    """Reconstruct the shortest path from u to v (None or -1 means no path)."""
+    if next_node[u][v] is None or next_node[u][v] < 0:
         return []
     path = [u]
     while u != v:
-        u = next_node[u][v]
+        u = int(next_node[u][v])
         path.append(u)
     return path
 
 
+# On-disk all-pairs store:
+#   header (64 bytes): magic b"APSP", version (u32), n (u64),
+#                      dist dtype (8-byte NumPy code, e.g. b"<f8"), padding
+#   dist      n x n of the dist dtype, starting at byte 64
+#   next_node n x n int32 (-1 = no path), starting at the next 64-byte boundary
+STORE_MAGIC = b"APSP"
+STORE_VERSION = 1
+STORE_HEADER = struct.Struct("<4sIQ8s")
+STORE_ALIGN = 64
+
+
+def _aligned(offset):
+    return (offset + STORE_ALIGN - 1) // STORE_ALIGN * STORE_ALIGN
+
+
+def save_all_pairs(path, dist, next_node, dtype=np.float64):
+    """Write dist / next_node (lists or arrays) to `path` in the store format."""
+    if isinstance(next_node, list):  # None-based form from floyd_warshall_with_path
+        next_node = [[-1 if x is None else x for x in row] for row in next_node]
+    dist = np.asarray(dist, dtype=dtype)
+    nxt = np.asarray(next_node, dtype=np.int32)
+    n = len(dist)
+    code = dist.dtype.str.encode()
+
+    with open(path, "wb") as f:
+        f.write(STORE_HEADER.pack(STORE_MAGIC, STORE_VERSION, n, code).ljust(STORE_ALIGN, b"\0"))
+        f.write(dist.tobytes())
+        f.write(b"\0" * (_aligned(f.tell()) - f.tell()))
+        f.write(nxt.astype("<i4").tobytes())
+
+
+class AllPairsStore:
+    """
+    Read-only view of a saved all-pairs table through mmap.
+    Nothing is loaded up front: dist and next_node are NumPy arrays over
+    the mapped file, so each query only touches the pages it reads, and
+    worker processes opening the same file share those pages through the
+    OS page cache.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, n, code = STORE_HEADER.unpack_from(self.mm, 0)
+        if magic != STORE_MAGIC or version != STORE_VERSION:
+            self.mm.close()
+            raise ValueError(f"{path} is not an all-pairs store (version {STORE_VERSION})")
+
+        dtype = np.dtype(code.rstrip(b"\0").decode())
+        self.n = n
+        self.dist = np.frombuffer(self.mm, dtype=dtype, count=n * n, offset=STORE_ALIGN).reshape(n, n)
+        offset = _aligned(STORE_ALIGN + n * n * dtype.itemsize)
+        self.next_node = np.frombuffer(self.mm, dtype="<i4", count=n * n, offset=offset).reshape(n, n)
+
+    def distance(self, u, v):
+        return float(self.dist[u, v])
+
+    def construct_path(self, u, v):
+        return construct_path(u, v, self.next_node)
+
+    def close(self):
+        # The arrays hold buffer exports on the map; drop them first
+        del self.dist, self.next_node
+        self.mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
 # Example usage
 if __name__ == "__main__":
     INF = float('inf')
@@ -56,3 +299,10 @@ if __name__ == "__main__":
                     print(f"Path {i} → {j}: {' -> '.join(map(str, path))} | Distance = {dist[i][j]}")
                 else:
                     print(f"Path {i} → {j}: No path exists")
+
+    # Incremental updates: make 0 -> 2 a direct edge, then remove 2 -> 3
+    index = AllPairsIndex(A)
+    index.set_edge(0, 2, 4)
+    print(f"\nAfter 0 → 2 = 4: Path 0 → 3: {' -> '.join(map(str, index.path(0, 3)))} | Distance = {index.distance(0, 3)}")
+    index.set_edge(2, 3, INF)
+    print(f"After removing 2 → 3: Path 0 → 3: {' -> '.join(map(str, index.path(0, 3)))} | Distance = {index.distance(0, 3)}")
@@ -1,25 +1,275 @@
 # 0/1 Knapsack Problem using DP
 
+import numbers
+
+import numpy as np
+
+# Sub-problems with at most this many (item, capacity) cells are solved
+# with a full table of take/skip decisions instead of being split further.
+TABLE_CELLS = 1 << 20
+
+
+def _profit_dtype(profits):
+    """int64 for integer profits, float64 (or wider) as soon as one is a float."""
+    p = np.asarray(profits)
+    return np.result_type(p, np.int64) if p.size else np.dtype(np.int64)
+
+
+def knapsack_row(weights, profits, capacity):
+    """
+    Rolling one-row DP.
+    Returns row[w] = maximum profit using all items with weight limit w,
+    for every w in 0..capacity, in O(capacity) memory.
+    """
+    row = np.zeros(capacity + 1, dtype=_profit_dtype(profits))
+
+    for wt, pr in zip(weights, profits):
+        if wt > capacity or pr <= 0:
+            continue
+        if wt == 0:
+            row += pr
+            continue
+        # row[w] = max(row[w], row[w - wt] + pr) for every w >= wt at once.
+        # The right hand side is a copy, so each item is used at most once.
+        candidate = row[:capacity + 1 - wt] + pr
+        np.maximum(row[wt:], candidate, out=row[wt:])
+
+    return row
+
+
 def knapsack(weights, profits, capacity):
-    n = len(weights)
-    
-    # Create a 2D DP table where dp[i][w] represents the maximum profit 
-    # for the first i items with weight limit w
-    dp = [[0 for _ in range(capacity + 1)] for _ in range(n + 1)]
-
-    # Build table dp[][] in bottom-up manner
-    for i in range(1, n + 1):
-        for w in range(1, capacity + 1):
-            if weights[i - 1] <= w:
-                # Include the item or exclude it — take the maximum profit
-                dp[i][w] = max(profits[i - 1] + dp[i - 1][w - weights[i - 1]], 
-                               dp[i - 1][w])
+    """Maximum profit for the given capacity."""
+    return knapsack_row(weights, profits, capacity)[capacity].item()
+
+
+def _table_items(weights, profits, items, capacity):
+    """Pick the best subset of `items` with a full take/skip table."""
+    row = np.zeros(capacity + 1, dtype=_profit_dtype([profits[i] for i in items]))
+    take = np.zeros((len(items), capacity + 1), dtype=bool)
+
+    for t, i in enumerate(items):
+        wt, pr = weights[i], profits[i]
+        if wt > capacity or pr <= 0:
+            continue
+        candidate = row[:capacity + 1 - wt] + pr
+        better = candidate > row[wt:]
+        take[t, wt:] = better
+        row[wt:][better] = candidate[better]
+
+    # Walk the decisions backwards from the full capacity
+    chosen = []
+    w = capacity
+    for t in range(len(items) - 1, -1, -1):
+        if take[t, w]:
+            chosen.append(items[t])
+            w -= weights[items[t]]
+    return chosen
+
+
+def _split_items(weights, profits, items, capacity, chosen):
+    """
+    Hirschberg-style divide and conquer.
+    The item list is halved and a forward row is computed for each half.
+    The best way to share the capacity between the halves is then the
+    split s maximising front[s] + back[capacity - s], and each half is
+    solved again with its own share.
+    """
+    if len(items) * (capacity + 1) <= TABLE_CELLS or len(items) == 1:
+        chosen.extend(_table_items(weights, profits, items, capacity))
+        return
+
+    mid = len(items) // 2
+    left, right = items[:mid], items[mid:]
+
+    front = knapsack_row([weights[i] for i in left], [profits[i] for i in left], capacity)
+    back = knapsack_row([weights[i] for i in right], [profits[i] for i in right], capacity)
+    s = int(np.argmax(front + back[::-1]))
+    del front, back
+
+    _split_items(weights, profits, left, s, chosen)
+    _split_items(weights, profits, right, capacity - s, chosen)
+
+
+def knapsack_items(weights, profits, capacity):
+    """
+    Maximum profit together with the indices of the chosen items,
+    using O(capacity) memory per level of the divide and conquer.
+    """
+    items = [i for i in range(len(weights)) if weights[i] <= capacity and profits[i] > 0]
+    chosen = []
+    if items:
+        _split_items(weights, profits, items, capacity, chosen)
+    chosen.sort()
+    return sum(profits[i] for i in chosen), chosen
+
+
+def knapsack_sparse(weights, profits, capacity):
+    """
+    Pareto-frontier knapsack for large capacities with few items.
+    Only non-dominated (weight, profit) states are kept: sorted by weight,
+    each state must have strictly more profit than every lighter one.
+    Each state carries a linked chain (item, previous chain) so the chosen
+    items can be read back without storing a table.
+    Returns (max profit, chosen item indices).
+    """
+    frontier = [(0, 0, None)]  # (weight, profit, chain)
+
+    for i, (wt, pr) in enumerate(zip(weights, profits)):
+        if wt > capacity or pr <= 0:
+            continue
+
+        shifted = [(w + wt, p + pr, (i, chain)) for w, p, chain in frontier if w + wt <= capacity]
+
+        # Merge the two weight-sorted lists, dropping dominated states
+        merged = []
+        a = b = 0
+        while a < len(frontier) or b < len(shifted):
+            if b == len(shifted) or (a < len(frontier) and frontier[a][:2] <= shifted[b][:2]):
+                state = frontier[a]
+                a += 1
             else:
-                # Cannot include the item if weight exceeds capacity
-                dp[i][w] = dp[i - 1][w]
+                state = shifted[b]
+                b += 1
+            if not merged or state[1] > merged[-1][1]:
+                if merged and state[0] == merged[-1][0]:
+                    merged[-1] = state  # same weight, more profit
+                else:
+                    merged.append(state)
+        frontier = merged
 
-    # The bottom-right cell contains the maximum profit
-    return dp[n][capacity]
+    _, best, chain = frontier[-1]
+    chosen = []
+    while chain is not None:
+        chosen.append(chain[0])
+        chain = chain[1]
+    chosen.reverse()
+    return best, chosen
+
+
+def knapsack_by_profit(weights, profits, capacity):
+    """
+    Profit-indexed DP for small integer profits.
+    row[q] = minimum weight that reaches profit exactly q; the answer is the
+    largest q whose minimum weight fits. Memory is O(sum of profits).
+    """
+    if not all(isinstance(pr, numbers.Integral) for pr in profits):
+        raise ValueError("knapsack_by_profit needs integer profits")
+    total = sum(pr for wt, pr in zip(weights, profits) if wt <= capacity and pr > 0)
+    unreachable = np.iinfo(np.int64).max // 2
+    row = np.full(total + 1, unreachable, dtype=np.int64)
+    row[0] = 0
+
+    for wt, pr in zip(weights, profits):
+        if wt > capacity or pr <= 0:
+            continue
+        candidate = row[:total + 1 - pr] + wt
+        np.minimum(row[pr:], candidate, out=row[pr:])
+
+    return int(np.flatnonzero(row <= capacity)[-1])
+
+
+# Rough cost of one frontier state in pure Python relative to one NumPy cell
+SPARSE_STATE_COST = 50
+
+
+def choose_strategy(weights, profits, capacity):
+    """
+    Pick "dense", "sparse" or "profit" from the size of the work each one does.
+    dense  -> n * (capacity + 1) cells
+    profit -> n * (sum of profits + 1) cells
+    sparse -> n * frontier size, where the frontier is bounded by the number
+              of subsets, distinct weights and distinct profits
+    """
+    items = [(wt, pr) for wt, pr in zip(weights, profits) if wt <= capacity and pr > 0]
+    n = len(items)
+    total_profit = sum(pr for _, pr in items)
+
+    dense = n * (capacity + 1)
+    profit = n * (total_profit + 1)
+    frontier = min(2 ** min(n, 62), capacity + 1, total_profit + 1)
+    sparse = n * frontier * SPARSE_STATE_COST
+
+    costs = {"dense": dense, "sparse": sparse, "profit": profit}
+    if not all(isinstance(pr, numbers.Integral) for _, pr in items):
+        del costs["profit"]  # profits must be usable as table indices
+    return min(costs, key=costs.get)
+
+
+def solve_knapsack(weights, profits, capacity, strategy="auto"):
+    """Maximum profit using the chosen (or automatically picked) engine."""
+    if strategy == "auto":
+        strategy = choose_strategy(weights, profits, capacity)
+
+    if strategy == "dense":
+        return knapsack(weights, profits, capacity)
+    if strategy == "sparse":
+        return knapsack_sparse(weights, profits, capacity)[0]
+    if strategy == "profit":
+        return knapsack_by_profit(weights, profits, capacity)
+    raise ValueError(f"unknown strategy: {strategy}")
+
+
+class KnapsackIndex:
+    """
+    Knapsack table shared by many capacity queries over one item catalogue.
+
+    The table is built once up to max_capacity. Only the latest profit row
+    is kept in full; for every item a boolean row records at which
+    capacities the item was taken, which is enough to backtrack the items.
+        best_profit(c) -> O(1) lookup in the latest row
+        items(c)       -> O(n) walk back through the take rows
+        add_item(w, p) -> appends one DP row, O(max_capacity)
+    The profit row starts as int64 and becomes float64 once a float profit
+    is added.
+    """
+
+    def __init__(self, weights, profits, max_capacity):
+        self.max_capacity = max_capacity
+        self.weights = []
+        self.profits = []
+        self.take = []
+        self.row = np.zeros(max_capacity + 1, dtype=np.int64)
+        for wt, pr in zip(weights, profits):
+            self.add_item(wt, pr)
+
+    def add_item(self, weight, profit):
+        """Add one item to the catalogue and return its index."""
+        take = np.zeros(self.max_capacity + 1, dtype=bool)
+        if weight <= self.max_capacity and profit > 0:
+            dtype = np.result_type(self.row, np.asarray(profit))
+            if dtype != self.row.dtype:
+                self.row = self.row.astype(dtype)
+            row = self.row
+            candidate = row[:self.max_capacity + 1 - weight] + profit
+            better = candidate > row[weight:]
+            take[weight:] = better
+            row[weight:][better] = candidate[better]
+
+        self.weights.append(weight)
+        self.profits.append(profit)
+        self.take.append(take)
+        return len(self.weights) - 1
+
+    def _check(self, capacity):
+        if not 0 <= capacity <= self.max_capacity:
+            raise ValueError(f"capacity must be between 0 and {self.max_capacity}")
+
+    def best_profit(self, capacity):
+        """Maximum profit for the given capacity."""
+        self._check(capacity)
+        return self.row[capacity].item()
+
+    def items(self, capacity):
+        """Indices of the items chosen for the given capacity."""
+        self._check(capacity)
+        chosen = []
+        w = capacity
+        for i in range(len(self.take) - 1, -1, -1):
+            if self.take[i][w]:
+                chosen.append(i)
+                w -= self.weights[i]
+        chosen.reverse()
+        return chosen
 
 
 # Example usage
@@ -30,3 +280,12 @@ if __name__ == "__main__":
 
     max_profit = knapsack(weights, profits, capacity)
     print("Maximum Profit:", max_profit)
+
+    best, chosen = knapsack_items(weights, profits, capacity)
+    print("Chosen Items:", chosen)
+
+    print("Strategy:", choose_strategy(weights, profits, capacity))
+
+    index = KnapsackIndex(weights, profits, max_capacity=10)
+    for c in range(11):
+        print(f"Capacity {c}: profit {index.best_profit(c)}, items {index.items(c)}")
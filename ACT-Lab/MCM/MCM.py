@@ -1,5 +1,11 @@
 # Matrix Chain Multiplication using Dynamic Programming
 
+from fractions import Fraction
+from functools import lru_cache
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
 def matrix_chain_order(dims):
     """
     dims: list of matrix dimensions.
@@ -29,6 +35,258 @@ def matrix_chain_order(dims):
     return m, k
 
 
+def matrix_chain_order_np(dims):
+    """
+    Same DP as matrix_chain_order with every chain length L handled as one
+    NumPy operation over all (i, split) pairs of that diagonal.
+
+    To make every operand a plain slice, costs are also kept by offset:
+        by_start[i][t] = m[i][i + t]   (left parts  A[i..x])
+        by_end[j][s]   = m[j - s][j]   (right parts A[x+1..j])
+    Returns m (int64) and k (int32) as (n + 1) x (n + 1) arrays.
+    """
+    n = len(dims) - 1
+    d = np.asarray(dims, dtype=np.int64)
+
+    by_start = np.zeros((n + 1, n + 1), dtype=np.int64)
+    by_end = np.zeros((n + 1, n + 1), dtype=np.int64)
+    k = np.zeros((n + 1, n + 1), dtype=np.int32)
+
+    for L in range(2, n + 1):
+        i = np.arange(1, n - L + 2)
+        j = i + L - 1
+
+        left = by_start[1:n - L + 2, :L - 1]     # m[i][x]       for x = i .. j-1
+        right = by_end[L:n + 1, L - 2::-1]       # m[x + 1][j]   for x = i .. j-1
+        mid = sliding_window_view(d, L - 1)[1:n - L + 2]  # dims[x]
+        cost = left + right + (d[i - 1] * d[j])[:, None] * mid
+
+        best = np.argmin(cost, axis=1)
+        best_cost = cost[np.arange(len(i)), best]
+        by_start[i, L - 1] = best_cost
+        by_end[j, L - 1] = best_cost
+        k[i, j] = i + best
+
+    m = np.zeros((n + 1, n + 1), dtype=np.int64)
+    for i in range(1, n + 1):
+        m[i, i:] = by_start[i, :n + 1 - i]
+    return m, k
+
+
+def hu_shing_heuristic_order(dims):
+    """
+    O(n) Hu-Shing one-sweep heuristic (near-optimal, not exact).
+
+    The chain is seen as a polygon whose vertices carry dims[0..n]; every
+    triangulation is a parenthesization costing the sum of its triangle
+    products. With V1 the lightest vertex, a vertex c between neighbours
+    a and b is cut off by the arc a-b when
+        1/w1 + 1/wc < 1/wa + 1/wb
+    i.e. when the triangle a-c-b is cheaper than joining c to V1. One
+    sweep with a stack removes all such vertices and the rest is joined
+    to V1 as a fan.
+    Returns the cost and k as a list of dicts, so k[i][j] works like the
+    DP table but only the splits of the plan are stored.
+    """
+    n = len(dims) - 1
+    w = dims
+    start = min(range(n + 1), key=lambda v: w[v])
+    order = [(start + t) % (n + 1) for t in range(n + 1)]
+
+    triangles = []
+    stack = order[:2]
+    for b in order[2:]:
+        while len(stack) >= 3:
+            a, c = stack[-2], stack[-1]
+            # 1/w1 + 1/wc < 1/wa + 1/wb, multiplied out to stay in integers
+            if w[a] * w[b] * (w[c] + w[start]) < w[start] * w[c] * (w[a] + w[b]):
+                triangles.append((a, c, b))
+                stack.pop()
+            else:
+                break
+        stack.append(b)
+
+    for t in range(1, len(stack) - 1):
+        triangles.append((start, stack[t], stack[t + 1]))
+
+    # Triangle i < x < j closes the range of matrices i+1..j with split x
+    cost = 0
+    k = [dict() for _ in range(n + 1)]
+    for tri in triangles:
+        i, x, j = sorted(tri)
+        cost += w[i] * w[x] * w[j]
+        k[i + 1][j] = x
+    return cost, k
+
+
+def hu_shing_order(dims):
+    """
+    Exact Hu-Shing ordering, O(n log n).
+
+    Same polygon view as hu_shing_heuristic_order, rotated so that V1 (the
+    lightest vertex) is position 0. Hu and Shing show an optimal
+    triangulation exists that only uses
+      - potential h-arcs: arcs i-j whose inner vertices are all heavier
+        than both ends. One stack sweep finds them (at most n of them)
+        and they nest, so they form a tree;
+      - fans: every region left between the chosen arcs is joined to its
+        lightest vertex (an end of the arc above it, or V1 at the top).
+    If the region above an arc c = a-b is fanned from a vertex of weight x,
+    keeping c costs G(c) + x*wa*wb, where G(c) is the best cost below c.
+    Dropping c merges the part below c into the fan, which costs S(x) =
+    x * (edge products on that part) + (G of the arcs still kept inside).
+    c is kept once x reaches its threshold t(c), the root of
+    G(c) + x*wa*wb = S(x). Arcs are solved bottom-up. The arcs still
+    kept below c sit in a leftist max-heap keyed by threshold; lowering x
+    opens every arc whose threshold is above it. Each arc is opened at
+    most once and heaps are merged up the tree, which gives O(n log n).
+    Returns the cost and k in the same form as hu_shing_heuristic_order.
+    """
+    n = len(dims) - 1
+    start = min(range(n + 1), key=lambda v: (dims[v], v))
+    vertex = [(start + p) % (n + 1) for p in range(n + 1)]
+    w = [dims[v] for v in vertex]
+
+    # Potential h-arcs over positions 1..n; ties go to the earlier position
+    arcs = []
+    stack = []
+    for j in range(1, n + 1):
+        while stack and w[stack[-1]] > w[j]:
+            t = stack.pop()
+            if t != j - 1:
+                arcs.append((t, j))
+        if stack and stack[-1] != j - 1:
+            arcs.append((stack[-1], j))
+        stack.append(j)
+
+    # Nesting tree. Sorted by (i, -j), every arc comes after its parent;
+    # the extra node `root` is the top region 1..n fanned from V1
+    arcs.sort(key=lambda arc: (arc[0], -arc[1]))
+    root = len(arcs)
+    lo = [a for a, _ in arcs] + [1]
+    hi = [b for _, b in arcs] + [n]
+    children = [[] for _ in range(root + 1)]
+    stack = []
+    for c in range(root):
+        while stack and hi[stack[-1]] <= lo[c]:
+            stack.pop()
+        children[stack[-1] if stack else root].append(c)
+        stack.append(c)
+
+    edge = [w[q] * w[q + 1] for q in range(n)]
+    prefix = [0]
+    for e in edge:
+        prefix.append(prefix[-1] + e)
+    wab = [w[a] * w[b] for a, b in arcs] + [0]
+
+    # Leftist heaps over arc ids, largest threshold on top
+    key = [float('inf')] * (root + 1)
+    left = [-1] * (root + 1)
+    right = [-1] * (root + 1)
+    rank = [1] * (root + 1) + [0]  # rank[-1] is the empty heap
+
+    def merge(x, y):
+        if x < 0:
+            return y
+        if y < 0:
+            return x
+        if key[x] < key[y]:
+            x, y = y, x
+        right[x] = merge(right[x], y)
+        if rank[left[x]] < rank[right[x]]:
+            left[x], right[x] = right[x], left[x]
+        rank[x] = rank[right[x]] + 1
+        return x
+
+    # Per arc, once solved: G, S at its own fan weight, and the state of
+    # S just below its threshold (slope, base, heap of the arcs kept)
+    G = [0] * root
+    own_s = [0] * root
+    slope = [0] * root
+    base = [0] * root
+    heap = [-1] * root
+
+    def open_top(h, sl, bs):
+        """Drop the arc on top of heap h, putting its own kept arcs in its place."""
+        d = h
+        h = merge(merge(left[d], right[d]), heap[d])
+        return h, sl + slope[d] - wab[d], bs + base[d] - G[d]
+
+    for c in range(root - 1, -1, -1):
+        a, b = arcs[c]
+        m = a if w[a] <= w[b] else b
+        x = w[m]
+        kids = children[c]
+
+        # S(x): edges not under a child, plus every child kept
+        sl, bs, h = 0, 0, -1
+        q = a
+        for d in kids:
+            sl += prefix[lo[d]] - prefix[q] + wab[d]
+            bs += G[d]
+            h = merge(h, d)
+            q = hi[d]
+        sl += prefix[b] - prefix[q]
+        while h >= 0 and key[h] > x:
+            h, sl, bs = open_top(h, sl, bs)
+        s = x * sl + bs
+
+        # G(c) is the fan from m, which has no triangle on the chain
+        # element touching m: take that element out of S(x)
+        if kids and m == a and lo[kids[0]] == a:
+            d = kids[0]
+        elif kids and m == b and hi[kids[-1]] == b:
+            d = kids[-1]
+        else:
+            d = None
+        if d is None:
+            g = s - x * (edge[a] if m == a else edge[b - 1])
+        else:
+            g = s - (G[d] + x * wab[d] if key[d] <= x else own_s[d]) + G[d]
+        G[c], own_s[c] = g, s
+
+        # Threshold: walk x down until S(x) drops below G(c) + x*wa*wb
+        t = float('inf')
+        if s >= g + x * wab[c]:
+            while True:
+                low = key[h] if h >= 0 else 0
+                if h < 0 or low * (sl - wab[c]) + bs < g:
+                    t = Fraction(g - bs, sl - wab[c]) if sl > wab[c] else low
+                    break
+                h, sl, bs = open_top(h, sl, bs)
+        key[c] = t
+        slope[c], base[c], heap[c] = sl, bs, h
+
+    # Read the triangles back from the top: (c, m) is c's chain fanned from m
+    triangles = []
+    todo = [(root, 0)]
+    while todo:
+        c, m = todo.pop()
+        q = lo[c]
+        for d in children[c] + [None]:
+            for p in range(q, lo[d] if d is not None else hi[c]):
+                if m != p and m != p + 1:
+                    triangles.append((m, p, p + 1))
+            if d is None:
+                break
+            q = hi[d]
+            if m == lo[d] or m == hi[d]:
+                todo.append((d, m))
+            elif key[d] <= w[m]:
+                triangles.append((m, lo[d], hi[d]))
+                todo.append((d, lo[d] if w[lo[d]] <= w[hi[d]] else hi[d]))
+            else:
+                todo.append((d, m))
+
+    cost = 0
+    k = [dict() for _ in range(n + 1)]
+    for tri in triangles:
+        i, x, j = sorted(vertex[p] for p in tri)
+        cost += dims[i] * dims[x] * dims[j]
+        k[i + 1][j] = x
+    return cost, k
+
+
 def print_optimal_parens(k, i, j):
     """Utility to print optimal parenthesization."""
     if i == j:
@@ -40,19 +298,136 @@ def print_optimal_parens(k, i, j):
         print(")", end="")
 
 
+@lru_cache(maxsize=256)
+def chain_plan(dims):
+    """
+    Evaluation plan for a chain, cached by the dims tuple.
+
+    The split table k is walked with an explicit stack (no recursion limit)
+    and turned into a list of steps (out, left, right) in evaluation order.
+    Operands >= 0 are input matrices; operands < 0 are temporary slots
+    -(slot + 1). Slots are recycled by shape once their value has been
+    used, and the last step has out = None (the final result).
+    Returns (steps, slot_shapes).
+    """
+    n = len(dims) - 1
+    _, k = matrix_chain_order_np(dims)
+
+    # Post-order walk over the ranges A[i..j]
+    order = []
+    stack = [(1, n, False)]
+    while stack:
+        i, j, expanded = stack.pop()
+        if i == j:
+            continue
+        x = int(k[i][j])
+        if expanded:
+            order.append((i, x, j))
+        else:
+            stack.append((i, j, True))
+            stack.append((x + 1, j, False))
+            stack.append((i, x, False))
+
+    steps = []
+    slot_shapes = []
+    free = {}     # shape -> slots whose value is no longer needed
+    value = {}    # (i, j) -> operand holding A[i..j]
+    for t, (i, x, j) in enumerate(order):
+        left = value.pop((i, x), i - 1)
+        right = value.pop((x + 1, j), x)
+
+        if t == len(order) - 1:
+            out = None
+        else:
+            # Allocate before freeing the operands so out never aliases them
+            shape = (dims[i - 1], dims[j])
+            if free.get(shape):
+                out = free[shape].pop()
+            else:
+                out = len(slot_shapes)
+                slot_shapes.append(shape)
+            value[(i, j)] = -(out + 1)
+
+        for operand in (left, right):
+            if operand < 0:
+                slot = -operand - 1
+                free.setdefault(slot_shapes[slot], []).append(slot)
+
+        steps.append((out, left, right))
+
+    return tuple(steps), tuple(slot_shapes)
+
+
+class ChainMultiplier:
+    """
+    Multiplies chains of NumPy arrays in the optimal order.
+    Intermediate buffers are kept per (dims, dtype), so multiplying chains
+    of the same shapes again does not allocate temporaries.
+    """
+
+    def __init__(self):
+        self.buffers = {}
+
+    def multiply(self, matrices, out=None):
+        if not matrices:
+            raise ValueError("need at least one matrix")
+
+        dims = [matrices[0].shape[0]]
+        for idx, a in enumerate(matrices):
+            if a.ndim != 2 or a.shape[0] != dims[-1]:
+                raise ValueError(f"matrix {idx} has shape {a.shape}, expected ({dims[-1]}, *)")
+            dims.append(a.shape[1])
+        dims = tuple(dims)
+
+        if len(matrices) == 1:
+            if out is None:
+                return matrices[0].copy()
+            out[...] = matrices[0]
+            return out
+
+        steps, slot_shapes = chain_plan(dims)
+        dtype = np.result_type(*matrices)
+        key = (dims, dtype)
+        if key not in self.buffers:
+            self.buffers[key] = [np.empty(shape, dtype=dtype) for shape in slot_shapes]
+        slots = self.buffers[key]
+
+        def operand(code):
+            return matrices[code] if code >= 0 else slots[-code - 1]
+
+        for dst, left, right in steps:
+            target = slots[dst] if dst is not None else out
+            result = np.matmul(operand(left), operand(right), out=target)
+        return result
+
+    def clear(self):
+        """Drop all cached intermediate buffers."""
+        self.buffers.clear()
+
+
+def chain_product(matrices):
+    """Multiply a list of matrices in the optimal order (no buffer reuse)."""
+    return ChainMultiplier().multiply(matrices)
+
+
 # Example usage:
-dims = [30, 35, 15, 5, 10, 20, 25]  # Example from standard DP textbooks
-m, k = matrix_chain_order(dims)
+if __name__ == "__main__":
+    dims = [30, 35, 15, 5, 10, 20, 25]  # Example from standard DP textbooks
+    m, k = matrix_chain_order(dims)
+
+    print("Scalar Multiplication Table (m):")
+    for row in m[1:len(dims)]:
+        print(row[1:len(dims)])
 
-print("Scalar Multiplication Table (m):")
-for row in m[1:len(dims)]:
-    print(row[1:len(dims)])
+    print("\nK Table (Split Positions):")
+    for row in k[1:len(dims)]:
+        print(row[1:len(dims)])
 
-print("\nK Table (Split Positions):")
-for row in k[1:len(dims)]:
-    print(row[1:len(dims)])
+    print("\nOptimal Parenthesization:")
+    print_optimal_parens(k, 1, len(dims) - 1)
 
-print("\nOptimal Parenthesization:")
-print_optimal_parens(k, 1, len(dims) - 1)
+    print(f"\n\nMinimum number of multiplications: {m[1][len(dims) - 1]}")
 
-print(f"\n\nMinimum number of multiplications: {m[1][len(dims) - 1]}")
+    matrices = [np.random.rand(dims[i], dims[i + 1]) for i in range(len(dims) - 1)]
+    product = ChainMultiplier().multiply(matrices)
+    print("Product shape:", product.shape)
@@ -0,0 +1,50 @@
+# Benchmark of the matrix chain ordering engines in MCM.py
+
+import random
+import time
+
+from MCM import hu_shing_heuristic_order, hu_shing_order, matrix_chain_order, matrix_chain_order_np
+
+# The DPs are O(n^3) (the NumPy one also keeps O(n^2) tables); skip them
+# above these chain lengths
+PYTHON_LIMIT = 400
+NUMPY_LIMIT = 1600
+
+
+def timed(fn, dims):
+    start = time.perf_counter()
+    result = fn(dims)
+    return result, time.perf_counter() - start
+
+
+def run(sizes, seed=0):
+    random.seed(seed)
+    print(f"{'n':>6} {'python (s)':>12} {'numpy (s)':>12} {'exact (s)':>12} "
+          f"{'heuristic (s)':>14} {'heuristic / optimal':>20}")
+
+    for n in sizes:
+        dims = [random.randint(1, 1000) for _ in range(n + 1)]
+        (best, _), t_ex = timed(hu_shing_order, dims)
+
+        if n <= PYTHON_LIMIT:
+            (m, _), t_py = timed(matrix_chain_order, dims)
+            assert m[1][n] == best
+            py = f"{t_py:12.3f}"
+        else:
+            py = f"{'-':>12}"
+
+        if n <= NUMPY_LIMIT:
+            (m, _), t_np = timed(matrix_chain_order_np, dims)
+            assert m[1][n] == best
+            nu = f"{t_np:12.3f}"
+        else:
+            nu = f"{'-':>12}"
+
+        (cost, _), t_hs = timed(hu_shing_heuristic_order, dims)
+        ratio = cost / best
+
+        print(f"{n:>6} {py} {nu} {t_ex:12.4f} {t_hs:14.4f} {ratio:20.4f}")
+
+
+if __name__ == "__main__":
+    run([50, 100, 200, 400, 800, 1600, 3200, 6400])
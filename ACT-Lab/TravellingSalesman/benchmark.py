@@ -0,0 +1,35 @@
+# Core scaling of the layered Held-Karp DP in travellingSalesman.py
+
+import os
+import random
+import sys
+import time
+
+from travellingSalesman import held_karp
+
+
+def random_cost(n, seed=0):
+    random.seed(seed)
+    return [[0 if i == j else random.randint(1, 100) for j in range(n)] for i in range(n)]
+
+
+def run(sizes, max_workers):
+    cores = list(range(1, max_workers + 1))
+    print(f"{'n':>4} " + " ".join(f"{f'{w} core(s)':>12}" for w in cores) + f" {'speedup':>9}")
+
+    for n in sizes:
+        cost = random_cost(n)
+        times = []
+        for w in cores:
+            start = time.perf_counter()
+            held_karp(cost, workers=w)
+            times.append(time.perf_counter() - start)
+        row = " ".join(f"{t:11.2f}s" for t in times)
+        print(f"{n:>4} {row} {times[0] / min(times):8.2f}x")
+
+
+if __name__ == "__main__":
+    # Usage: python benchmark.py [max_n] [max_workers]
+    max_n = int(sys.argv[1]) if len(sys.argv) > 1 else 22
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+    run(range(18, max_n + 1), max_workers)
@@ -1,37 +1,212 @@
 import math
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+def _layers(m):
+    """
+    Group all masks over m bits by popcount.
+    Returns (order, starts, rank): masks of popcount k are
+    order[starts[k]:starts[k + 1]] in increasing order, and rank[mask] is
+    the position of mask inside its layer.
+    """
+    popcount = np.zeros(1 << m, dtype=np.uint8)
+    for b in range(m):
+        popcount[1 << b:1 << (b + 1)] = popcount[:1 << b] + 1
+
+    order = np.argsort(popcount, kind="stable").astype(np.int64)
+    starts = np.concatenate(([0], np.cumsum(np.bincount(popcount, minlength=m + 1))))
+    rank = np.empty(1 << m, dtype=np.int32)
+    for k in range(m + 1):
+        layer = order[starts[k]:starts[k + 1]]
+        rank[layer] = np.arange(len(layer))
+    return order, starts, rank
+
+
+def _extend_layer(prev_dp, layer, rank, cost, dp, parent):
+    """
+    Fill dp and parent for (a slice of) one popcount layer from the
+    previous layer:
+        dp[r][j] = min over i of prev_dp[rank[mask ^ bit j]][i] + cost[i][j]
+    for the mask at position r of `layer`; cities 1..m are numbered 0..m-1
+    here. Entries with j outside the mask are inf.
+    """
+    m = dp.shape[1]
+    dp.fill(np.inf)
+    for j in range(m):
+        rows = np.flatnonzero(layer & (1 << j))
+        if not len(rows):
+            continue
+        prev = rank[layer[rows] ^ (1 << j)]
+        total = prev_dp[prev] + cost[1:, 1 + j]
+        best = np.argmin(total, axis=1)
+        dp[rows, j] = total[np.arange(len(rows)), best]
+        parent[rows, j] = best
+
+
+def _first_layer(order, starts, cost, dp):
+    """Layer 1: tours 0 -> j."""
+    dp.fill(np.inf)
+    for r, mask in enumerate(order[starts[1]:starts[2]]):
+        j = int(mask).bit_length() - 1
+        dp[r, j] = cost[0, 1 + j]
+
+
+def _layer_view(buf, rows, m):
+    return buf[:rows * m].reshape(rows, m)
+
+
+def _serial_layers(cost, m, order, starts, rank, parents):
+    dp = np.empty((m, m))
+    _first_layer(order, starts, cost, dp)
+    for k in range(2, m + 1):
+        layer = order[starts[k]:starts[k + 1]]
+        new = np.empty((len(layer), m))
+        _extend_layer(dp, layer, rank, cost, new, parents[starts[k]:starts[k + 1]])
+        dp = new
+    return dp
+
+
+# Views onto the shared DP state inside a Held-Karp worker process
+_hk = {}
+
+
+def _hk_attach(names, m, widest):
+    """Map the shared blocks as NumPy arrays (no copies)."""
+    blocks = [shared_memory.SharedMemory(name=name) for name in names]
+    size = 1 << m
+    arrays = {
+        "order": np.ndarray(size, dtype=np.int64, buffer=blocks[0].buf),
+        "rank": np.ndarray(size, dtype=np.int32, buffer=blocks[1].buf),
+        "parents": np.ndarray((size, m), dtype=np.uint8, buffer=blocks[2].buf),
+        "dp": [np.ndarray(widest * m, dtype=np.float64, buffer=blocks[3].buf),
+               np.ndarray(widest * m, dtype=np.float64, buffer=blocks[4].buf)],
+    }
+    return blocks, arrays
 
-def travelling_salesman(cost):
-    n = len(cost)
-    VISITED_ALL = (1 << n) - 1  # bitmask when all cities are visited
 
-    # dp[mask][i] = minimum cost to reach city i with visited mask
-    dp = [[math.inf] * n for _ in range(1 << n)]
-    dp[1][0] = 0  # start from city 0
+def _hk_init(names, m, widest, starts, cost):
+    blocks, arrays = _hk_attach(names, m, widest)
+    _hk.update(arrays, blocks=blocks, m=m, starts=starts, cost=cost)
 
-    for mask in range(1 << n):
-        for u in range(n):
-            if not (mask & (1 << u)):  # if city u not in mask
-                continue
-            for v in range(n):
-                if mask & (1 << v):  # if city v already visited
-                    continue
-                new_mask = mask | (1 << v)
-                dp[new_mask][v] = min(dp[new_mask][v], dp[mask][u] + cost[u][v])
 
-    # Return to start city (0)
-    ans = math.inf
-    for i in range(1, n):
-        ans = min(ans, dp[VISITED_ALL][i] + cost[i][0])
+def _hk_rows(k, lo, hi):
+    """Worker: rows lo..hi of layer k, written in place into shared memory."""
+    m, starts = _hk["m"], _hk["starts"]
+    base = starts[k]
+    prev = _layer_view(_hk["dp"][(k - 1) % 2], starts[k] - starts[k - 1], m)
+    cur = _layer_view(_hk["dp"][k % 2], starts[k + 1] - base, m)
+    _extend_layer(prev, _hk["order"][base + lo:base + hi], _hk["rank"], _hk["cost"],
+                  cur[lo:hi], _hk["parents"][base + lo:base + hi])
 
-    return ans
+
+def _parallel_layers(cost, m, order, starts, rank, workers, chunk):
+    """
+    Same layers as _serial_layers, with each layer split into row ranges
+    for a process pool. order, rank, the parent table and two ping-pong
+    dp buffers (layers k-1 and k) live in shared memory, so workers read
+    the previous layer and write their rows of the next one in place.
+    Returns the last dp layer and a private copy of the parent table.
+    """
+    widest = int(np.max(np.diff(starts)))
+    sizes = [order.nbytes, rank.nbytes, (1 << m) * m, widest * m * 8, widest * m * 8]
+    blocks = [shared_memory.SharedMemory(create=True, size=size) for size in sizes]
+    names = [block.name for block in blocks]
+    try:
+        _, arrays = _hk_attach(names, m, widest)
+        arrays["order"][:] = order
+        arrays["rank"][:] = rank
+        _first_layer(order, starts, cost, _layer_view(arrays["dp"][1], m, m))
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_hk_init,
+                                 initargs=(names, m, widest, starts, cost)) as pool:
+            for k in range(2, m + 1):
+                rows = int(starts[k + 1] - starts[k])
+                step = max(chunk, -(-rows // (4 * workers)))
+                tasks = [pool.submit(_hk_rows, k, lo, min(lo + step, rows))
+                         for lo in range(0, rows, step)]
+                for task in tasks:
+                    task.result()  # the next layer needs all of this one
+
+        dp = _layer_view(arrays["dp"][m % 2], 1, m).copy()
+        parents = arrays["parents"].copy()
+        del arrays
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+    return dp, parents
+
+
+def held_karp(cost, workers=None, chunk=1024):
+    """
+    Held-Karp DP processed layer by layer by popcount.
+
+    City 0 is always the start, so it is left out of the masks: a mask
+    over cities 1..n-1 stands for "0 plus these cities". This halves the
+    table compared with also storing masks that lack city 0. Only the
+    previous layer of costs is kept; the parent pointers are a uint8
+    table, which is enough to rebuild the tour at the end.
+    With workers > 1 every layer is split across a process pool
+    (see _parallel_layers).
+    Returns (minimum cost, tour starting and ending at 0).
+    """
+    c = np.asarray(cost, dtype=np.float64)
+    n = len(c)
+    if n == 1:
+        return 0, [0, 0]
+    if n > 256:
+        raise ValueError("parent pointers are uint8; at most 256 cities")
+
+    m = n - 1
+    order, starts, rank = _layers(m)
+
+    if workers is not None and workers > 1 and m > 1:
+        dp, parents = _parallel_layers(c, m, order, starts, rank, workers, chunk)
+    else:
+        parents = np.zeros((1 << m, m), dtype=np.uint8)
+        dp = _serial_layers(c, m, order, starts, rank, parents)
+
+    # Close the tour back to city 0
+    closing = dp[0] + c[1:, 0]
+    j = int(np.argmin(closing))
+    best = closing[j]
+    if best == math.inf:
+        return math.inf, []
+
+    tour = [0]
+    mask = (1 << m) - 1
+    for k in range(m, 1, -1):
+        tour.append(1 + j)
+        i = int(parents[starts[k] + rank[mask], j])
+        mask ^= 1 << j
+        j = i
+    tour.append(1 + j)
+    tour.append(0)
+    tour.reverse()
+
+    if np.issubdtype(np.asarray(cost).dtype, np.integer):
+        best = int(best)
+    return best, tour
+
+
+def travelling_salesman(cost):
+    """Minimum cost of a tour starting and ending at city 0."""
+    return held_karp(cost)[0]
 
 
 # Example usage
-cost = [
-    [0, 10, 15, 20],
-    [10, 0, 35, 25],
-    [15, 35, 0, 30],
-    [20, 25, 30, 0]
-]
-
-print("Minimum cost of the TSP tour:", travelling_salesman(cost))
\ No newline at end of file
+if __name__ == "__main__":
+    cost = [
+        [0, 10, 15, 20],
+        [10, 0, 35, 25],
+        [15, 35, 0, 30],
+        [20, 25, 30, 0]
+    ]
+
+    print("Minimum cost of the TSP tour:", travelling_salesman(cost))
+
+    best, tour = held_karp(cost)
+    print("Optimal tour:", " -> ".join(map(str, tour)))
@@ -0,0 +1,333 @@
+# Anytime TSP heuristics for large (500-5000 city) symmetric instances
+#
+# Every function takes the same input as the exact solvers: an n x n
+# distance matrix (list of lists or NumPy array). Tours are returned in
+# the same form as held_karp / tsp_branch_and_bound: a list that starts and
+# ends at city 0, so costs can be compared directly on small inputs.
+
+import random
+import time
+from collections import deque
+
+import numpy as np
+
+EPS = 1e-9
+
+
+def distance_matrix(points):
+    """Euclidean distance matrix for an (n, 2) array of points."""
+    p = np.asarray(points, dtype=np.float64)
+    return np.hypot(p[:, 0, None] - p[None, :, 0], p[:, 1, None] - p[None, :, 1])
+
+
+def tour_length(D, tour):
+    D = np.asarray(D, dtype=np.float64)
+    t = np.asarray(tour)
+    return float(D[t[:-1], t[1:]].sum())
+
+
+def _closed(order):
+    """Rotate a cyclic city order to start at 0 and close it."""
+    i = order.index(0)
+    return order[i:] + order[:i] + [0]
+
+
+def neighbour_lists(D, k=10, chunk=512):
+    """The k nearest other cities of every city, nearest first."""
+    D = np.asarray(D, dtype=np.float64)
+    n = len(D)
+    k = min(k, n - 1)
+    neigh = np.empty((n, k), dtype=np.int32)
+
+    for lo in range(0, n, chunk):
+        rows = np.arange(lo, min(lo + chunk, n))
+        sub = D[rows].copy()
+        sub[np.arange(len(rows)), rows] = np.inf
+        idx = np.argpartition(sub, k - 1, axis=1)[:, :k]
+        order = np.argsort(np.take_along_axis(sub, idx, axis=1), axis=1)
+        neigh[rows] = np.take_along_axis(idx, order, axis=1)
+    return neigh
+
+
+# ---------- Construction ----------
+
+def nearest_neighbour(D, start=0):
+    """Always move to the closest unvisited city; O(n^2) with NumPy rows."""
+    D = np.asarray(D, dtype=np.float64)
+    n = len(D)
+    visited = np.zeros(n, dtype=bool)
+    order = [start]
+    visited[start] = True
+    for _ in range(n - 1):
+        row = np.where(visited, np.inf, D[order[-1]])
+        nxt = int(np.argmin(row))
+        visited[nxt] = True
+        order.append(nxt)
+    return _closed(order)
+
+
+def greedy_edge(D, neigh=None):
+    """
+    Greedy matching construction: scan candidate edges from the neighbour
+    lists shortest first and keep an edge if both cities still have degree
+    < 2 and it does not close a cycle. The resulting path fragments are
+    then chained together, each time joining the nearest free endpoint.
+    """
+    D = np.asarray(D, dtype=np.float64)
+    n = len(D)
+    if neigh is None:
+        neigh = neighbour_lists(D)
+
+    edges = sorted({(D[a, b], min(a, b), max(a, b)) for a in range(n) for b in neigh[a].tolist()})
+    parent = list(range(n))
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    adj = [[] for _ in range(n)]
+    for _, a, b in edges:
+        if len(adj[a]) < 2 and len(adj[b]) < 2 and find(a) != find(b):
+            parent[find(a)] = find(b)
+            adj[a].append(b)
+            adj[b].append(a)
+
+    # Walk each fragment from one of its ends
+    fragments = []
+    seen = [False] * n
+    for city in range(n):
+        if seen[city] or len(adj[city]) == 2:
+            continue
+        frag = [city]
+        seen[city] = True
+        prev, curr = -1, city
+        while True:
+            nxt = [x for x in adj[curr] if x != prev]
+            if not nxt:
+                break
+            prev, curr = curr, nxt[0]
+            seen[curr] = True
+            frag.append(curr)
+        fragments.append(frag)
+
+    # Chain fragments: from the current end, go to the nearest free endpoint
+    order = fragments.pop(0)
+    heads = np.array([f[0] for f in fragments], dtype=np.int64)
+    tails = np.array([f[-1] for f in fragments], dtype=np.int64)
+    alive = np.ones(len(fragments), dtype=bool)
+    for _ in range(len(fragments)):
+        row = D[order[-1]]
+        to_head = np.where(alive, row[heads], np.inf)
+        to_tail = np.where(alive, row[tails], np.inf)
+        h, t = int(np.argmin(to_head)), int(np.argmin(to_tail))
+        if to_head[h] <= to_tail[t]:
+            order.extend(fragments[h])
+            alive[h] = False
+        else:
+            order.extend(reversed(fragments[t]))
+            alive[t] = False
+    return _closed(order)
+
+
+# ---------- Local search ----------
+
+class _Tour:
+    """Cyclic tour as an array plus city -> position index."""
+
+    def __init__(self, order):
+        self.order = list(order)
+        self.n = len(self.order)
+        self.pos = [0] * self.n
+        for i, city in enumerate(self.order):
+            self.pos[city] = i
+
+    def succ(self, c):
+        return self.order[(self.pos[c] + 1) % self.n]
+
+    def pred(self, c):
+        return self.order[self.pos[c] - 1]
+
+    def _reverse(self, x, y):
+        """Reverse the forward path x..y, or its complement if that is shorter."""
+        order, pos, n = self.order, self.pos, self.n
+        i, j = pos[x], pos[y]
+        length = (j - i) % n + 1
+        if 2 * length > n:
+            i, j = (j + 1) % n, (i - 1) % n
+            length = n - length
+        for _ in range(length // 2):
+            a, b = order[i], order[j]
+            order[i], order[j] = b, a
+            pos[a], pos[b] = j, i
+            i = (i + 1) % n
+            j = (j - 1) % n
+
+    def move(self, a, b, c, d):
+        """2-opt exchange: drop edges a-b and c-d (b after a, d after c in
+        the same direction) and add a-c and b-d."""
+        if self.succ(a) == b:
+            self._reverse(b, c)
+        else:
+            self._reverse(c, b)
+
+
+class _LocalSearch:
+    """
+    Neighbour-list 2-opt and Or-opt driven by a queue of "dirty" cities
+    (don't-look bits): a city is only re-examined after one of its tour
+    edges changed.
+    """
+
+    def __init__(self, D, neigh, deadline):
+        self.dist = memoryview(np.ascontiguousarray(D, dtype=np.float64))
+        self.neigh = neigh.tolist()
+        self.deadline = deadline
+
+    def run(self, tour, queue):
+        dist, deadline = self.dist, self.deadline
+        queued = [False] * tour.n
+        for c in queue:
+            queued[c] = True
+        queue = deque(queue)
+        steps = 0
+
+        while queue:
+            steps += 1
+            if deadline is not None and steps % 64 == 0 and time.perf_counter() > deadline:
+                return False  # out of time; tour is still valid
+            a = queue.popleft()
+            queued[a] = False
+
+            touched = self._two_opt(tour, a, dist) or self._or_opt(tour, a, dist)
+            if touched:
+                for c in touched:
+                    if not queued[c]:
+                        queued[c] = True
+                        queue.append(c)
+        return True
+
+    def _two_opt(self, tour, a, dist):
+        for step in (tour.succ, tour.pred):
+            b = step(a)
+            d_ab = dist[a, b]
+            for c in self.neigh[a]:
+                d_ac = dist[a, c]
+                if d_ac >= d_ab:
+                    break
+                d = step(c)
+                if c == b or d == a:
+                    continue
+                if d_ac + dist[b, d] - d_ab - dist[c, d] < -EPS:
+                    tour.move(a, b, c, d)
+                    return (a, b, c, d)
+        return None
+
+    def _or_opt(self, tour, s, dist):
+        """Move the segment of 1-3 cities starting at s between two neighbours."""
+        n = tour.n
+        for length in (1, 2, 3):
+            if length + 3 > n:
+                break
+            e = s
+            for _ in range(length - 1):
+                e = tour.succ(e)
+            p, nx = tour.pred(s), tour.succ(e)
+            removed = dist[p, s] + dist[e, nx] - dist[p, nx]
+
+            for c in self.neigh[s] + self.neigh[e]:
+                if (tour.pos[c] - tour.pos[s]) % n < length or c == p:
+                    continue
+                d = tour.succ(c)
+                forward = dist[c, s] + dist[e, d] - dist[c, d]
+                backward = dist[c, e] + dist[s, d] - dist[c, d]
+                if min(forward, backward) - removed < -EPS:
+                    # Three 2-opt exchanges: p c..nx e..s d, p nx..c e..s d,
+                    # then optionally flip the segment back to s..e
+                    tour.move(p, s, c, d)
+                    tour.move(p, c, nx, e)
+                    if forward < backward and length > 1:
+                        tour.move(c, e, s, d)
+                    return (p, nx, s, e, c, d)
+        return None
+
+
+def two_opt(D, tour, neigh=None, deadline=None):
+    """2-opt + Or-opt local optimum (or best reached by the deadline)."""
+    if neigh is None:
+        neigh = neighbour_lists(D)
+    t = _Tour(tour[:-1])
+    _LocalSearch(D, neigh, deadline).run(t, list(t.order))
+    return _closed(t.order)
+
+
+def _double_bridge(order, rng):
+    """Random 4-opt kick A B C D -> A C B D that 2-opt cannot undo."""
+    n = len(order)
+    i, j, k = sorted(rng.sample(range(1, n), 3))
+    new = order[:i] + order[j:k] + order[i:j] + order[k:]
+    ends = {order[i - 1], order[i], order[j - 1], order[j], order[k - 1], order[k % n], order[0], order[-1]}
+    return new, list(ends)
+
+
+def solve(D, time_limit=1.0, k=10, construction="greedy", seed=0):
+    """
+    Anytime heuristic: build a tour, take it to a 2-opt / Or-opt local
+    optimum, then keep applying double-bridge kicks followed by local
+    search on the kicked cities (iterated local search, in the spirit of
+    LKH's kicks) until time_limit seconds have passed.
+    Returns (cost, tour) for the best tour found so far.
+    """
+    deadline = time.perf_counter() + time_limit
+    D = np.asarray(D, dtype=np.float64)
+    n = len(D)
+    if n <= 3:
+        tour = list(range(n)) + [0]
+        return tour_length(D, tour), tour
+
+    neigh = neighbour_lists(D, k)
+    if construction == "greedy":
+        tour = greedy_edge(D, neigh)
+    elif construction == "nearest":
+        tour = nearest_neighbour(D)
+    else:
+        raise ValueError(f"unknown construction: {construction}")
+
+    search = _LocalSearch(D, neigh, deadline)
+    t = _Tour(tour[:-1])
+    search.run(t, list(t.order))
+    best = t.order[:]
+    best_cost = tour_length(D, _closed(best))
+
+    rng = random.Random(seed)
+    while n >= 8 and time.perf_counter() < deadline:
+        kicked, dirty = _double_bridge(best, rng)
+        t = _Tour(kicked)
+        search.run(t, dirty)
+        cost = tour_length(D, _closed(t.order))
+        if cost < best_cost - EPS:
+            best, best_cost = t.order[:], cost
+
+    tour = _closed(best)
+    return tour_length(D, tour), tour
+
+
+# Example usage: compare against the exact DP on small inputs
+if __name__ == "__main__":
+    from travellingSalesman import held_karp
+
+    rng = np.random.default_rng(0)
+    print(f"{'n':>6} {'exact':>10} {'heuristic':>10} {'gap':>8}")
+    for n in (8, 10, 12, 14):
+        D = distance_matrix(rng.random((n, 2)) * 1000)
+        exact, _ = held_karp(D)
+        cost, _ = solve(D, time_limit=0.2)
+        print(f"{n:>6} {exact:10.1f} {cost:10.1f} {100 * (cost / exact - 1):7.2f}%")
+
+    n = 1000
+    D = distance_matrix(rng.random((n, 2)) * 1000)
+    nn = tour_length(D, nearest_neighbour(D))
+    for limit in (0.5, 2.0, 5.0):
+        cost, tour = solve(D, time_limit=limit)
+        print(f"n = {n}, {limit:.1f} s: {cost:.1f} (nearest neighbour {nn:.1f})")